@@ -0,0 +1,14 @@
+from CommonUtilities.AsyncDriverFunctionUtilities import AsyncDriverUtilitiesMethod
+from Locators import HomePageLocator as Hpl
+
+
+class AsyncHomePageFunctions(AsyncDriverUtilitiesMethod):
+    """
+    Async counterpart of HomePageFunctions for sessions driven by AsyncDriverUtilitiesMethod.
+    """
+
+    async def click_revenue_calculator_btn(self):
+        """
+        Clicks on the revenue calculator button on the homepage.
+        """
+        await self.click_element(element_locator=Hpl.revenue_calculator_btn)
@@ -0,0 +1,147 @@
+from selenium.webdriver import Keys
+from selenium.common.exceptions import NoSuchElementException
+from CommonUtilities.AsyncDriverFunctionUtilities import AsyncDriverUtilitiesMethod, element_id
+from App.RevenuePageFunctions import _SLIDER_GEOMETRY_SCRIPT, _CPT_STATE_SCRIPT, _CPT_SETTLE_SCRIPT
+from Locators import RevenuePageLocator as Rpl
+
+
+class AsyncRevenuePageFunction(AsyncDriverUtilitiesMethod):
+    """
+    Async counterpart of RevenuePageFunction: the same page scripts and checks, awaited on an
+    AsyncWebDriverSession so that many sessions can share one event loop.
+    """
+
+    async def read_slider_geometry(self):
+        """
+        Reads the range input bounds, the current value and the track/thumb positions in one script call.
+
+        Returns:
+            dict: See RevenuePageFunction.read_slider_geometry; 'thumb' is the thumb's element id.
+        """
+        geometry = await self.driver.execute_script(
+            _SLIDER_GEOMETRY_SCRIPT, Rpl.slider_btn_input.value, Rpl.slider_btn_input.strategy
+        )
+        geometry['thumb'] = element_id(geometry['thumb'])
+        return geometry
+
+    async def move_slider_to_value(self, value: int):
+        """
+        Moves the slider with a computed drag and an arrow key correction (see RevenuePageFunction.move_slider_to_value).
+
+        Returns:
+            tuple: (final slider value, number of WebDriver commands sent on the session).
+        """
+        commands_before = self.driver.commands_sent
+        geometry = await self.read_slider_geometry()
+        current_value = int(geometry['value'])
+        span = geometry['max'] - geometry['min']
+
+        if current_value != value and span:
+            # Closed-form pixel position of the target value on the track, reached with one drag
+            target_x = geometry['track_left'] + (value - geometry['min']) / span * geometry['track_width']
+            await self.drag_element_by_offset(geometry['thumb'], round(target_x - geometry['thumb_x']), 0)
+            geometry = await self.read_slider_geometry()
+            current_value = int(geometry['value'])
+
+        # Within pixel resolution: one arrow key press per remaining step on the focused range input
+        if current_value != value and span and geometry['step']:
+            presses = round(abs(value - current_value) / geometry['step'])
+            key = Keys.ARROW_RIGHT if value > current_value else Keys.ARROW_LEFT
+            await self.driver.execute_script('arguments[0].focus();', geometry['input'])
+            await self.driver.perform_actions([{'type': 'key', 'id': 'keyboard', 'actions': [
+                {'type': key_type, 'value': key} for _ in range(presses) for key_type in ('keyDown', 'keyUp')
+            ]}])
+            current_value = int((await self.read_slider_geometry())['value'])
+
+        return current_value, self.driver.commands_sent - commands_before
+
+    async def move_and_check_slider_by_value(self, value: int):
+        """
+        Moves the slider to a specific value and checks if the value matches the expected one.
+        """
+        current_value, round_trips = await self.move_slider_to_value(value)
+        if current_value != value:
+            print(f"Expected: {value}, but got: {current_value} ({round_trips} round trips)")
+        else:
+            print(f"Expected: {value}, matched with current value: {current_value} ({round_trips} round trips)")
+
+    async def fill_and_check_value_in_slider_input(self, value):
+        """
+        Clears the slider input and types the value in a single actions request, then checks the range input.
+        """
+        await self.fill_text_using_action_chain(element_locator=Rpl.slider_value_input, text=Keys.BACKSPACE * 5 + value)
+        current_value = await self.get_attribute_value_of_element(
+            element_locator=Rpl.slider_btn_input,
+            attribute_name='value'
+        )
+        if current_value != value:
+            print(f"Expected: {value}, but got: {current_value}")
+        else:
+            print(f"Expected: {value}, matched with current value: {current_value}")
+
+    async def select_cpts(self, codes, quiet_period=0.15):
+        """
+        Brings every listed CPT checkbox into the checked state (see RevenuePageFunction.select_cpts).
+
+        Returns:
+            dict: Keys 'states', 'total' and 'timed_out'.
+        """
+        entries = []
+        for code in codes:
+            locator = Rpl.cpt_check_box_dynamic.format(cpt_to_select=code)
+            entries.append([code, locator.value, locator.strategy])
+
+        rows = await self.driver.execute_script(_CPT_STATE_SCRIPT, entries)
+        missing = [code for code in codes if rows.get(code) is None]
+        if missing:
+            raise NoSuchElementException(f"CPT rows not found: {', '.join(missing)}")
+
+        for code in codes:
+            if not rows[code]['checked']:
+                await self.driver.click(element_id(rows[code]['element']))
+
+        timeout = self.explicit_timeout
+        await self._ensure_script_timeout(timeout)
+        result = await self.driver.execute_async_script(
+            _CPT_SETTLE_SCRIPT, entries, Rpl.total_recurring_amount.value, Rpl.total_recurring_amount.strategy,
+            int(quiet_period * 1000), int(timeout * 1000)
+        )
+        if result['timed_out']:
+            print(f"Total recurring amount did not settle within {timeout}s (last read: {result['total']})")
+        for code in codes:
+            if not result['states'][code]:
+                print(f"Expected CPT {code} to be checked, but it is not")
+        return result
+
+    async def check_revenue_page_state(self, slider_value, cpt_list, expected_total='$110700'):
+        """
+        Validates the slider values, the CPT checkbox states and the total recurring amount from a single page read.
+
+        Returns:
+            bool: True if every value matched, False otherwise.
+        """
+        queries = {
+            'slider_input': (Rpl.slider_value_input, 'attribute', 'value'),
+            'slider_range': (Rpl.slider_btn_input, 'attribute', 'value'),
+            'total_recurring_amount': (Rpl.total_recurring_amount, 'text'),
+        }
+        for cpt in cpt_list:
+            queries[f'cpt_{cpt}'] = (Rpl.cpt_check_box_dynamic.format(cpt_to_select=cpt), 'checked')
+        state = await self.query_elements(queries)
+
+        expectations = {
+            'slider_input': str(slider_value),
+            'slider_range': str(slider_value),
+            'total_recurring_amount': expected_total,
+        }
+        for cpt in cpt_list:
+            expectations[f'cpt_{cpt}'] = True
+
+        matched = True
+        for name, expected in expectations.items():
+            if state[name] != expected:
+                print(f"{name} expected: {expected}, but got: {state[name]}")
+                matched = False
+            else:
+                print(f"{name} expected: {expected}, matched with current value: {state[name]}")
+        return matched
@@ -0,0 +1,282 @@
+import time
+from CommonUtilities.DriverFunctionUtilities import DriverUtilitiesMethod
+from CommonUtilities.DriverSessionPool import is_session_fatal
+from App.HomePageFunctions import HomePageFunctions
+from App.RevenuePageFunctions import RevenuePageFunction
+from Locators import HomePageLocator as Hpl
+from Locators import RevenuePageLocator as Rpl
+
+# Window size the flow runs at
+WINDOW_SIZE = (1920, 1080)
+
+# RevenueModel per set of reimbursement rates, reused across the scenarios of a process
+_revenue_models = {}
+
+
+def expected_total_for(cd):
+    """
+    Returns the configured expected total, or computes it from the local revenue model.
+
+    Args:
+        cd (ConfigData): The configuration.
+
+    Returns:
+        str: The expected total recurring amount text.
+
+    Raises:
+        ValueError: If expected_total is None and no reimbursement rates are configured.
+    """
+    if cd.expected_total is not None:
+        return cd.expected_total
+    if not cd.cpt_reimbursement_rates:
+        raise ValueError("expected_total is None, so cpt_reimbursement_rates must be configured "
+                         "to compute it from the revenue model")
+    key = tuple(sorted(cd.cpt_reimbursement_rates.items()))
+    if key not in _revenue_models:
+        from App.RevenueModel import RevenueModel
+        _revenue_models[key] = RevenueModel(cd.cpt_reimbursement_rates)
+    return _revenue_models[key].expected_total(int(cd.slider_value_to_fill), cd.cpt_list_to_select)
+
+
+def size_browser_window(driver_function, driver):
+    """
+    Sets the browser window to WINDOW_SIZE, unless the driver was launched from a browser profile preset
+    at that size (DriverBase.launch records the preset settings as driver.browser_profile).
+
+    Args:
+        driver_function (DriverUtilitiesMethod): Helpers bound to the driver.
+        driver: The WebDriver instance.
+    """
+    settings = getattr(driver, 'browser_profile', None)
+    if settings and tuple(settings['window_size'] or ()) == WINDOW_SIZE:
+        return
+    driver_function.set_browser_window_size(width=str(WINDOW_SIZE[0]), height=str(WINDOW_SIZE[1]))
+
+
+def automation_flow_steps(driver, cd, profiler=None, use_element_cache=True):
+    """
+    Runs the revenue calculator flow as a generator of command batches.
+
+    Between batches the generator yields a readiness probe: a zero-argument callable that returns True
+    once the next batch can run without waiting (or None when there is nothing to wait for). A scheduler
+    can switch to other work until the probe passes; a plain caller can simply resume it, since the page
+    functions still wait on their own.
+
+    Args:
+        driver: The WebDriver instance (and current window) to run the flow on.
+        cd (ConfigData): The configuration (URL, slider values, CPT codes, expected total).
+        profiler (DriverProfiler): Optional profiler to attach to the page objects.
+        use_element_cache (bool): Reuse resolved revenue page elements. The cache belongs to the driver, not
+                                  to a window, so flows interleaved in several tabs of one driver turn it off.
+
+    Returns:
+        bool: Through StopIteration.value, True if the final page state matched the configuration.
+    """
+    # Instantiate page-specific functions for homepage and revenue page
+    homepage = HomePageFunctions(driver=driver, explicit_timeout=cd.explicit_timeout)
+    revenue_page = RevenuePageFunction(
+        driver=driver, explicit_timeout=cd.explicit_timeout, use_element_cache=use_element_cache
+    )
+    if profiler:
+        for page_object in (homepage, revenue_page):
+            profiler.attach(page_object)
+
+    # Navigate to the specified URL and hand over until the revenue calculator entry exists
+    homepage.navigate_to_url(cd.web_url)
+    yield lambda: homepage.is_element_present(Hpl.revenue_calculator_btn)
+
+    # Click on the revenue calculator button on the homepage and hand over until the slider exists
+    homepage.click_revenue_calculator_btn()
+    yield lambda: revenue_page.is_element_present(Rpl.slider_btn)
+
+    # Move the slider to a specific value and verify its value
+    revenue_page.move_and_check_slider_by_value(value=cd.slider_value_to_move)
+
+    # Fill the slider input field and verify the value
+    revenue_page.fill_and_check_value_in_slider_input(value=cd.slider_value_to_fill)
+    yield None
+
+    # Select all CPT checkboxes in one batch and wait for the total to settle
+    revenue_page.select_cpts(cd.cpt_list_to_select)
+
+    # Without a configured total, compute the expected one from the local revenue model
+    expected_total = expected_total_for(cd)
+
+    # Validate the slider, CPT checkboxes and total recurring amount with a single page read
+    return revenue_page.check_revenue_page_state(
+        slider_value=cd.slider_value_to_fill,
+        cpt_list=cd.cpt_list_to_select,
+        expected_total=expected_total
+    )
+
+
+def run_automation_flow(driver, cd, profiler=None):
+    """
+    Runs the revenue calculator flow on an already started driver.
+
+    - Navigates to the URL specified in the configuration.
+    - Interacts with the homepage and revenue page elements like buttons, sliders, and checkboxes.
+    - Validates the slider's value, the CPT checkboxes and the total recurring amount.
+
+    Args:
+        driver: The WebDriver instance to run the flow on.
+        cd (ConfigData): The configuration (URL, slider values, CPT codes, expected total).
+        profiler (DriverProfiler): Optional profiler to attach to the page objects.
+
+    Returns:
+        bool: True if the final page state matched the configuration, False otherwise.
+    """
+    # Setup driver functions with the explicit timeout setting from the configuration
+    driver_function = DriverUtilitiesMethod(driver=driver, explicit_timeout=cd.explicit_timeout)
+    if profiler:
+        profiler.attach(driver_function)
+
+    # Set the browser window size
+    size_browser_window(driver_function, driver)
+
+    # Run every batch back to back; the page functions wait for their elements themselves
+    steps = automation_flow_steps(driver, cd, profiler)
+    try:
+        while True:
+            next(steps)
+    except StopIteration as finished:
+        return finished.value
+
+
+class CheckpointedFlow:
+    """
+    This class runs the revenue calculator flow as named, idempotent steps that can be resumed.
+
+    Before each run the page state is probed in a single read (calculator visible, slider value, CPT
+    checkbox states) to find the furthest step whose effect is already in place, and the run continues
+    after it. Step failures are classified: a session-fatal error stops the run so that the caller can
+    relaunch the browser, while any other error leaves the session in place for the next run to resume.
+    """
+
+    steps = ('open_home', 'open_calculator', 'move_slider', 'fill_slider', 'select_cpts', 'validate')
+
+    def __init__(self, cd, profiler=None, on_step=None):
+        """
+        Args:
+            cd (ConfigData): The configuration (URL, slider values, CPT codes, expected total).
+            profiler (DriverProfiler): Optional profiler to attach to the page objects of each run.
+            on_step (callable): Optional callback called with the step name and its report entry
+                                whenever a step finishes or fails.
+        """
+        self.cd = cd
+        self.profiler = profiler
+        self.on_step = on_step
+        self.report = {name: {'status': 'pending', 'attempts': 0, 'seconds': 0.0, 'error': None}
+                       for name in self.steps}
+        self.session_lost = False
+        self.passed = None
+
+    def probe_state(self, revenue_page):
+        """
+        Returns the furthest step whose effect is already visible on the page, or None.
+
+        Args:
+            revenue_page (RevenuePageFunction): Page object bound to the session to probe.
+
+        Returns:
+            str: A step name from steps (never 'validate', which always runs), or None.
+        """
+        queries = {
+            'home_button': (Hpl.revenue_calculator_btn, 'rect'),
+            'slider_thumb': (Rpl.slider_btn, 'rect'),
+            'slider_input': (Rpl.slider_value_input, 'attribute', 'value'),
+            'slider_range': (Rpl.slider_btn_input, 'attribute', 'value'),
+        }
+        for cpt in self.cd.cpt_list_to_select:
+            queries[f'cpt_{cpt}'] = (Rpl.cpt_check_box_dynamic.format(cpt_to_select=cpt), 'checked')
+        state = revenue_page.query_elements(queries)
+
+        # Rendered with a box: present in the DOM is not enough, a hidden calculator has not been opened
+        def visible(rect):
+            return rect is not None and rect['width'] > 0 and rect['height'] > 0
+
+        calculator_visible = visible(state['slider_thumb'])
+        filled = str(self.cd.slider_value_to_fill)
+        probes = (
+            ('select_cpts', calculator_visible and state['slider_range'] == filled
+             and all(state[f'cpt_{cpt}'] for cpt in self.cd.cpt_list_to_select)),
+            ('fill_slider', calculator_visible and state['slider_range'] == filled and state['slider_input'] == filled),
+            ('move_slider', calculator_visible and state['slider_range'] == str(self.cd.slider_value_to_move)),
+            ('open_calculator', calculator_visible),
+            ('open_home', visible(state['home_button']) or calculator_visible),
+        )
+        return next((name for name, reached in probes if reached), None)
+
+    def run(self, driver):
+        """
+        Resumes the flow on a session from the furthest probed step.
+
+        Args:
+            driver: The WebDriver instance to run on (an existing session or a relaunched one).
+
+        Returns:
+            bool: True if every step completed; False if a step failed. session_lost tells whether
+                  the failure requires a new session.
+        """
+        self.session_lost = False
+        driver_function = DriverUtilitiesMethod(driver=driver, explicit_timeout=self.cd.explicit_timeout)
+        homepage = HomePageFunctions(driver=driver, explicit_timeout=self.cd.explicit_timeout)
+        revenue_page = RevenuePageFunction(
+            driver=driver, explicit_timeout=self.cd.explicit_timeout, use_element_cache=True
+        )
+        if self.profiler:
+            for page_object in (driver_function, homepage, revenue_page):
+                self.profiler.attach(page_object)
+
+        actions = {
+            'open_home': lambda: (size_browser_window(driver_function, driver),
+                                  driver_function.navigate_to_url(self.cd.web_url)),
+            'open_calculator': homepage.click_revenue_calculator_btn,
+            'move_slider': lambda: revenue_page.move_and_check_slider_by_value(value=self.cd.slider_value_to_move),
+            'fill_slider': lambda: revenue_page.fill_and_check_value_in_slider_input(value=self.cd.slider_value_to_fill),
+            'select_cpts': lambda: revenue_page.select_cpts(self.cd.cpt_list_to_select),
+            'validate': lambda: revenue_page.check_revenue_page_state(
+                slider_value=self.cd.slider_value_to_fill,
+                cpt_list=self.cd.cpt_list_to_select,
+                expected_total=expected_total_for(self.cd)
+            ),
+        }
+
+        name = 'probe'
+        try:
+            # Skip the steps whose effect is already on the page
+            reached = self.probe_state(revenue_page)
+            start = self.steps.index(reached) + 1 if reached else 0
+            for name in self.steps[:start]:
+                if self.report[name]['status'] != 'done':
+                    # A step that failed earlier but whose effect is now on the page is no longer in error
+                    self.report[name]['status'] = 'skipped'
+                    self.report[name]['error'] = None
+
+            for name in self.steps[start:]:
+                entry = self.report[name]
+                entry['attempts'] += 1
+                started = time.perf_counter()
+                try:
+                    outcome = actions[name]()
+                finally:
+                    entry['seconds'] += time.perf_counter() - started
+                entry['status'] = 'done'
+                entry['error'] = None
+                if name == 'validate':
+                    self.passed = bool(outcome)
+                    entry['status'] = 'done' if self.passed else 'mismatch'
+                if self.on_step:
+                    self.on_step(name, entry)
+            return True
+
+        except Exception as e:
+            self.session_lost = is_session_fatal(e)
+            if name in self.report:
+                self.report[name]['status'] = 'failed'
+                self.report[name]['error'] = f"{type(e).__name__}: {e}"
+                if self.on_step:
+                    self.on_step(name, self.report[name])
+            print(f"Step {name} failed with {type(e).__name__}"
+                  + (" (session lost)" if self.session_lost else " (resuming on the same session)"))
+            return False
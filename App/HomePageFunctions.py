@@ -18,3 +18,6 @@ class HomePageFunctions(DriverUtilitiesMethod):
         """
         # Click the revenue calculator button using the element locator defined in HomePageLocator
         self.click_element(element_locator=Hpl.revenue_calculator_btn)
+
+        # The click switches the page content, so elements cached from the homepage are no longer valid
+        self.invalidate_element_cache()
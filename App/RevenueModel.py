@@ -0,0 +1,178 @@
+import random
+import numpy as np
+
+
+def format_total(value):
+    """
+    Formats an amount the way the calculator displays it ('$110700', or '$1234.50' for fractional amounts).
+
+    Args:
+        value (float): The amount.
+
+    Returns:
+        str: The displayed total.
+    """
+    return f'${value:.0f}' if float(value).is_integer() else f'${value:.2f}'
+
+
+class RevenueTable:
+    """
+    This class holds precomputed expected totals for a grid of patient counts (rows) and CPT subsets
+    (columns), so that a combination is validated with an array lookup instead of a browser run.
+    """
+
+    def __init__(self, patient_counts, cpt_subsets, totals):
+        """
+        Args:
+            patient_counts (np.ndarray): Sorted patient counts, one per row.
+            cpt_subsets (list): CPT subsets (frozensets), one per column.
+            totals (np.ndarray): Expected totals of shape (len(patient_counts), len(cpt_subsets)).
+        """
+        self.patient_counts = patient_counts
+        self.cpt_subsets = cpt_subsets
+        self.totals = totals
+        self._columns = {subset: column for column, subset in enumerate(cpt_subsets)}
+
+    def lookup(self, patients, cpt_subset):
+        """
+        Returns the expected total for one combination.
+
+        Args:
+            patients (int): Patient count (slider value).
+            cpt_subset (iterable): Selected CPT codes.
+
+        Returns:
+            float: The expected total.
+
+        Raises:
+            KeyError: If the combination is not part of the table.
+        """
+        row = np.searchsorted(self.patient_counts, patients)
+        if row >= len(self.patient_counts) or self.patient_counts[row] != patients:
+            raise KeyError(f'Patient count {patients} is not in the table')
+        return float(self.totals[row, self._columns[frozenset(cpt_subset)]])
+
+    def lookup_many(self, patients, columns):
+        """
+        Returns expected totals for many combinations at once.
+
+        Args:
+            patients (array-like): Patient counts, all present in the table.
+            columns (array-like): Column indices into cpt_subsets, one per patient count.
+
+        Returns:
+            np.ndarray: The expected totals.
+        """
+        return self.totals[np.searchsorted(self.patient_counts, patients), np.asarray(columns)]
+
+    def sample(self, count, seed=None):
+        """
+        Picks combinations to cross-check in the browser.
+
+        Args:
+            count (int): Number of combinations.
+            seed (int): Seed for a reproducible sample.
+
+        Returns:
+            list: Tuples of (patients, sorted CPT codes, expected total text).
+        """
+        generator = random.Random(seed)
+        cells = generator.sample(range(self.totals.size), min(count, self.totals.size))
+        samples = []
+        for cell in cells:
+            row, column = divmod(cell, len(self.cpt_subsets))
+            samples.append((int(self.patient_counts[row]), sorted(self.cpt_subsets[column]),
+                            format_total(self.totals[row, column])))
+        return samples
+
+    def save(self, path):
+        """
+        Writes the table to a .npz file.
+        """
+        codes = sorted(set().union(*self.cpt_subsets))
+        membership = np.array([[code in subset for code in codes] for subset in self.cpt_subsets], dtype=bool)
+        np.savez_compressed(path, patient_counts=self.patient_counts, codes=np.array(codes),
+                            membership=membership, totals=self.totals)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a table written by save.
+        """
+        with np.load(path) as data:
+            codes = [str(code) for code in data['codes']]
+            subsets = [frozenset(code for code, member in zip(codes, row) if member) for row in data['membership']]
+            return cls(data['patient_counts'], subsets, data['totals'])
+
+
+class RevenueModel:
+    """
+    This class models the revenue calculator locally: the total recurring reimbursement is the patient
+    count times the sum of the reimbursement rates of the selected CPT codes. Totals for whole grids of
+    (patient count x CPT subset) are computed as NumPy arrays and cached as RevenueTable objects.
+    """
+
+    def __init__(self, rates):
+        """
+        Args:
+            rates (dict): CPT code mapped to its reimbursement rate per patient per month.
+        """
+        self.codes = sorted(rates)
+        self.rates = np.array([rates[code] for code in self.codes], dtype=float)
+        self._code_index = {code: index for index, code in enumerate(self.codes)}
+        self._tables = {}
+
+    def membership(self, cpt_subsets):
+        """
+        Returns a boolean matrix with one row per CPT subset and one column per known CPT code.
+        """
+        matrix = np.zeros((len(cpt_subsets), len(self.codes)), dtype=bool)
+        for row, subset in enumerate(cpt_subsets):
+            matrix[row, [self._code_index[code] for code in subset]] = True
+        return matrix
+
+    def expected_totals(self, patient_counts, cpt_subsets):
+        """
+        Computes expected totals for every combination of patient count and CPT subset.
+
+        Args:
+            patient_counts (array-like): Patient counts (slider values).
+            cpt_subsets (list): Iterables of CPT codes.
+
+        Returns:
+            np.ndarray: Totals of shape (len(patient_counts), len(cpt_subsets)).
+        """
+        per_patient = self.membership(cpt_subsets) @ self.rates
+        return np.outer(np.asarray(patient_counts, dtype=float), per_patient)
+
+    def expected_total(self, patients, cpt_subset):
+        """
+        Returns the displayed total for a single combination.
+
+        Args:
+            patients (int): Patient count (slider value).
+            cpt_subset (iterable): Selected CPT codes.
+
+        Returns:
+            str: The total as the calculator displays it.
+        """
+        per_patient = sum(float(self.rates[self._code_index[code]]) for code in cpt_subset)
+        return format_total(patients * per_patient)
+
+    def table(self, patient_counts, cpt_subsets):
+        """
+        Returns the lookup table for a grid, computing it on first use.
+
+        Args:
+            patient_counts (array-like): Patient counts (slider values).
+            cpt_subsets (list): Iterables of CPT codes.
+
+        Returns:
+            RevenueTable: The cached table.
+        """
+        patients = np.unique(np.asarray(patient_counts))
+        subsets = [frozenset(subset) for subset in cpt_subsets]
+        key = (patients.tobytes(), tuple(subsets))
+        if key not in self._tables:
+            self._tables[key] = RevenueTable(patients, subsets, self.expected_totals(patients, subsets))
+        return self._tables[key]
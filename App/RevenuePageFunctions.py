@@ -1,7 +1,108 @@
 from selenium.webdriver import Keys
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import NoSuchElementException
 from CommonUtilities.DriverFunctionUtilities import DriverUtilitiesMethod
 from Locators import RevenuePageLocator as Rpl
 
+# Reads the MUI range slider bounds, current value and track/thumb geometry in one call.
+# arguments[0] is the locator of the range input nested inside the slider thumb, arguments[1] its strategy.
+_SLIDER_GEOMETRY_SCRIPT = """
+var input = arguments[1] === 'xpath'
+    ? document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(arguments[0]);
+var thumb = input.parentElement;
+var root = thumb.closest('.MuiSlider-root') || thumb.parentElement;
+var rail = root.querySelector('.MuiSlider-rail') || root;
+var trackBox = rail.getBoundingClientRect();
+var thumbBox = thumb.getBoundingClientRect();
+return {
+    min: parseFloat(input.min || '0'),
+    max: parseFloat(input.max || '100'),
+    step: parseFloat(input.step || '1'),
+    value: parseFloat(input.value),
+    track_left: trackBox.left,
+    track_width: trackBox.width,
+    thumb_x: thumbBox.left + thumbBox.width / 2,
+    thumb: thumb,
+    input: input
+};
+"""
+
+
+# Resolves every CPT checkbox and reads its checked state in one call.
+# arguments[0] is a list of [code, locator, strategy] entries.
+_CPT_STATE_SCRIPT = """
+var rows = {};
+arguments[0].forEach(function (entry) {
+    var element = entry[2] === 'xpath'
+        ? document.evaluate(entry[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(entry[1]);
+    var box = element && ('checked' in element ? element : element.querySelector('input'));
+    rows[entry[0]] = element ? {element: element, checked: Boolean(box && box.checked)} : null;
+});
+return rows;
+"""
+
+# Resolves once the total recurring amount has kept the same text for a quiet period (or the timeout
+# passes) and then reads the CPT checked states and the total. Only the total's node is observed, so
+# unrelated page activity (carousels, animations, analytics) does not hold the gate open.
+# arguments: CPT entries as above, total locator, total strategy, quiet period ms, timeout ms, async callback.
+_CPT_SETTLE_SCRIPT = """
+var entries = arguments[0], totalLocator = arguments[1], totalStrategy = arguments[2];
+var quiet = arguments[3], timeout = arguments[4], done = arguments[arguments.length - 1];
+function find(locator, strategy) {
+    return strategy === 'xpath'
+        ? document.evaluate(locator, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(locator);
+}
+function totalText() {
+    var total = find(totalLocator, totalStrategy);
+    return total ? total.innerText.trim() : null;
+}
+function read(timedOut) {
+    var states = {};
+    entries.forEach(function (entry) {
+        var element = find(entry[1], entry[2]);
+        var box = element && ('checked' in element ? element : element.querySelector('input'));
+        states[entry[0]] = box ? Boolean(box.checked) : null;
+    });
+    return {states: states, total: totalText(), timed_out: timedOut};
+}
+var watched = null, observer = null, quietTimer = null, finished = false;
+var last = totalText();
+// (Re-)attach the observer when the total's node appears or is replaced by a re-render
+function watch() {
+    var total = find(totalLocator, totalStrategy);
+    if (total === watched) return;
+    if (observer) observer.disconnect();
+    watched = total;
+    observer = null;
+    if (total) {
+        observer = new MutationObserver(function () { clearTimeout(quietTimer); quietTimer = setTimeout(check, quiet); });
+        observer.observe(total, {subtree: true, childList: true, characterData: true});
+    }
+}
+// Settled when a full quiet period passed without mutations and the text is the one seen before it
+function check() {
+    watch();
+    var current = totalText();
+    if (current !== null && current === last) { finish(false); return; }
+    last = current;
+    quietTimer = setTimeout(check, quiet);
+}
+function finish(timedOut) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(quietTimer);
+    done(read(timedOut));
+}
+watch();
+quietTimer = setTimeout(check, quiet);
+setTimeout(function () { finish(true); }, timeout);
+"""
+
 
 class RevenuePageFunction(DriverUtilitiesMethod):
     """
@@ -10,6 +111,57 @@ class RevenuePageFunction(DriverUtilitiesMethod):
     It inherits from DriverUtilitiesMethod to leverage common driver functionalities.
     """
 
+    def read_slider_geometry(self):
+        """
+        Reads the range input bounds, the current value and the track/thumb positions in one script call.
+
+        Returns:
+            dict: Keys 'min', 'max', 'step', 'value', 'track_left', 'track_width', 'thumb_x', 'thumb'
+                  (the thumb WebElement, reused for follow-up drags) and 'input' (the range input).
+        """
+        self.flush_actions()
+        return self.driver.execute_script(
+            _SLIDER_GEOMETRY_SCRIPT, Rpl.slider_btn_input.value, Rpl.slider_btn_input.strategy
+        )
+
+    def move_slider_to_value(self, value: int):
+        """
+        Moves the slider to a specific value using a computed pixel offset instead of fixed-size steps.
+
+        The range input's min/max/step and the track's bounding box are read once, the pixel position of
+        the target value is computed and the thumb is dragged there with a single move_slider call.
+        Pointer offsets are whole pixels, so the thumb may land a few steps off; the remaining steps are
+        covered with arrow key presses on the focused range input, sent as one actions request.
+
+        Args:
+            value (int): The target value for the slider.
+
+        Returns:
+            tuple: (final slider value, number of WebDriver commands sent, counted on driver.execute).
+        """
+        with self.count_commands() as commands:
+            # Read min/max/step, the current value and the track box in a single round trip
+            geometry = self.read_slider_geometry()
+            current_value = int(geometry['value'])
+            span = geometry['max'] - geometry['min']
+
+            if current_value != value and span:
+                # Closed-form pixel position of the target value on the track, reached with one drag
+                target_x = geometry['track_left'] + (value - geometry['min']) / span * geometry['track_width']
+                self.move_slider(element_locator=Rpl.slider_btn, x_value=round(target_x - geometry['thumb_x']), y_value=0)
+                geometry = self.read_slider_geometry()
+                current_value = int(geometry['value'])
+
+            # Within pixel resolution: one arrow key press per remaining step, sent as a single actions request
+            if current_value != value and span and geometry['step']:
+                presses = round(abs(value - current_value) / geometry['step'])
+                key = Keys.ARROW_RIGHT if value > current_value else Keys.ARROW_LEFT
+                self.driver.execute_script('arguments[0].focus();', geometry['input'])
+                ActionChains(self.driver).send_keys(key * presses).perform()
+                current_value = int(self.read_slider_geometry()['value'])
+
+        return current_value, commands['count']
+
     def move_and_check_slider_by_value(self, value: int):
         """
         Moves the slider to a specific value and checks if the value matches the expected one.
@@ -17,29 +169,14 @@ class RevenuePageFunction(DriverUtilitiesMethod):
         Args:
             value (int): The target value for the slider.
         """
-        # Get the current value of the slider
-        current_value = int(self.get_attribute_value_of_element(
-            element_locator=Rpl.slider_btn_input,
-            attribute_name='value'
-        ))
-
-        # Move the slider in increments until the target value is reached
-        while abs(current_value - value) >= 5:
-            if current_value < value:
-                self.move_slider(element_locator=Rpl.slider_btn, x_value=10, y_value=0)
-            else:
-                self.move_slider(element_locator=Rpl.slider_btn, x_value=-1, y_value=0)
-            # Update current slider value
-            current_value = int(self.get_attribute_value_of_element(
-                element_locator=Rpl.slider_value_input,
-                attribute_name='value'
-            ))
+        # Position the slider with a computed drag and an arrow key correction
+        current_value, round_trips = self.move_slider_to_value(value)
 
         # Check if the final slider value matches the expected value
         if current_value != value:
-            print(f"Expected: {value}, but got: {current_value}")
+            print(f"Expected: {value}, but got: {current_value} ({round_trips} round trips)")
         else:
-            print(f"Expected: {value}, matched with current value: {current_value}")
+            print(f"Expected: {value}, matched with current value: {current_value} ({round_trips} round trips)")
 
     def fill_and_check_value_in_slider_input(self, value):
         """
@@ -48,15 +185,17 @@ class RevenuePageFunction(DriverUtilitiesMethod):
         Args:
             value (str): The value to fill in the slider input field.
         """
-        # Clear any existing value in the slider input field
-        self.fill_text_using_action_chain(element_locator=Rpl.slider_value_input, text='')
+        # Queue the clear and fill key strokes and send them as a single actions request
+        with self.batch_actions():
+            # Clear any existing value in the slider input field
+            self.fill_text_using_action_chain(element_locator=Rpl.slider_value_input, text='')
 
-        # Use BACKSPACE to clear the field if needed (for Windows/Linux compatibility)
-        for i in range(5):
-            self.press_keyboard_key(Keys.BACKSPACE)
+            # Use BACKSPACE to clear the field if needed (for Windows/Linux compatibility)
+            for i in range(5):
+                self.press_keyboard_key(Keys.BACKSPACE)
 
-        # Fill the input field with the new value
-        self.fill_text_using_action_chain(element_locator=Rpl.slider_value_input, text=value)
+            # Fill the input field with the new value
+            self.fill_text_using_action_chain(element_locator=Rpl.slider_value_input, text=value)
 
         # Get the current value from the slider button input and verify
         current_value = self.get_attribute_value_of_element(
@@ -83,17 +222,123 @@ class RevenuePageFunction(DriverUtilitiesMethod):
         # Click the corresponding CPT checkbox
         self.click_element(element_locator=Rpl.cpt_check_box_dynamic.format(cpt_to_select=cpt))
 
-    def check_total_recurring_amount(self):
+    def select_cpts(self, codes, quiet_period=0.15):
+        """
+        Brings every listed CPT checkbox into the checked state with batched reads.
+
+        All CPT rows are resolved and their states read in one call, only unchecked rows are clicked,
+        and completion is gated on the total settling (its text unchanged for quiet_period) before the
+        final checked states and total are read in the same call.
+
+        Args:
+            codes (list): The CPT codes to select.
+            quiet_period (float): Seconds without changes to the total after which it is considered settled.
+
+        Returns:
+            dict: Keys 'states' (CPT code mapped to its final checked state), 'total' (the total text) and
+                  'timed_out' (True if the total had not settled within the explicit timeout).
+        """
+        self.flush_actions()
+        entries = []
+        for code in codes:
+            locator = Rpl.cpt_check_box_dynamic.format(cpt_to_select=code)
+            locator_method, locator_value = self._resolve_locator(locator, 'xpath')
+            entries.append([code, locator_value, 'xpath' if locator_method == By.XPATH else 'css'])
+
+        # Resolve every row and its current state in one round trip
+        rows = self.driver.execute_script(_CPT_STATE_SCRIPT, entries)
+        missing = [code for code in codes if rows.get(code) is None]
+        if missing:
+            raise NoSuchElementException(f"CPT rows not found: {', '.join(missing)}")
+
+        # Click only the rows that are not already checked; the native click scrolls them into view
+        for code in codes:
+            if not rows[code]['checked']:
+                rows[code]['element'].click()
+
+        # Wait for the total to settle and read the final states in one round trip
+        timeout = self.explicit_timeout
+        self._ensure_script_timeout(timeout)
+        total_method, total_value = self._resolve_locator(Rpl.total_recurring_amount, 'xpath')
+        result = self.driver.execute_async_script(
+            _CPT_SETTLE_SCRIPT, entries, total_value, 'xpath' if total_method == By.XPATH else 'css',
+            int(quiet_period * 1000), int(timeout * 1000)
+        )
+
+        if result['timed_out']:
+            print(f"Total recurring amount did not settle within {timeout}s (last read: {result['total']})")
+        for code in codes:
+            if not result['states'][code]:
+                print(f"Expected CPT {code} to be checked, but it is not")
+        return result
+
+    def check_total_recurring_amount(self, expected_total='$110700'):
         """
         Checks the total recurring amount displayed on the revenue page and compares it with the expected value.
 
-        The expected total is hardcoded as '$110700'.
+        Args:
+            expected_total (str): The expected total text, e.g. from RevenueModel.expected_total.
+
+        Returns:
+            bool: True if the displayed total matched.
         """
         # Get the total recurring amount from the page
         current_value = self.get_text(element_locator=Rpl.total_recurring_amount)
 
         # Compare the actual total with the expected value
-        if current_value != '$110700':
-            print(f"Expected: {'$110700'}, but got: {current_value}")
-        else:
-            print(f"Expected: {'$110700'}, matched with current value: {current_value}")
+        if current_value != expected_total:
+            print(f"Expected: {expected_total}, but got: {current_value}")
+            return False
+        print(f"Expected: {expected_total}, matched with current value: {current_value}")
+        return True
+
+    def get_revenue_page_state(self, cpt_list):
+        """
+        Reads the slider input, the range input, every CPT checkbox state and the total recurring amount in one call.
+
+        Args:
+            cpt_list (list): The CPT codes whose checkbox states should be read.
+
+        Returns:
+            dict: Keys 'slider_input', 'slider_range', 'total_recurring_amount' and 'cpt_<code>' for each CPT.
+        """
+        queries = {
+            'slider_input': (Rpl.slider_value_input, 'attribute', 'value'),
+            'slider_range': (Rpl.slider_btn_input, 'attribute', 'value'),
+            'total_recurring_amount': (Rpl.total_recurring_amount, 'text'),
+        }
+        for cpt in cpt_list:
+            queries[f'cpt_{cpt}'] = (Rpl.cpt_check_box_dynamic.format(cpt_to_select=cpt), 'checked')
+        return self.query_elements(queries)
+
+    def check_revenue_page_state(self, slider_value, cpt_list, expected_total='$110700'):
+        """
+        Validates the slider values, the CPT checkbox states and the total recurring amount from a single page read.
+
+        Args:
+            slider_value (str): The expected value of both the slider input and the range input.
+            cpt_list (list): The CPT codes that are expected to be checked.
+            expected_total (str): The expected total recurring amount text.
+
+        Returns:
+            bool: True if every value matched, False otherwise.
+        """
+        state = self.get_revenue_page_state(cpt_list)
+
+        # Pair each read value with its expectation and report every mismatch
+        expectations = {
+            'slider_input': str(slider_value),
+            'slider_range': str(slider_value),
+            'total_recurring_amount': expected_total,
+        }
+        for cpt in cpt_list:
+            expectations[f'cpt_{cpt}'] = True
+
+        matched = True
+        for name, expected in expectations.items():
+            if state[name] != expected:
+                print(f"{name} expected: {expected}, but got: {state[name]}")
+                matched = False
+            else:
+                print(f"{name} expected: {expected}, matched with current value: {state[name]}")
+        return matched
@@ -0,0 +1,95 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CommonUtilities.BrowserProfiles import PRESETS  # noqa: E402
+from CommonUtilities.DriverBaseUtilities import DriverBase  # noqa: E402
+from CommonUtilities.DriverFunctionUtilities import DriverUtilitiesMethod  # noqa: E402
+from ConfigData.ConfigData import ConfigData  # noqa: E402
+from Benchmarks.RevenuePageBenchmark import percentile  # noqa: E402
+import Locators.HomePageLocator as Hpl  # noqa: E402
+
+# domInteractive and the load event of the current page, relative to navigation start, in milliseconds
+_NAVIGATION_TIMING_SCRIPT = """
+const entry = performance.getEntriesByType('navigation')[0];
+return entry ? [entry.domInteractive, entry.loadEventEnd] : [null, null];
+"""
+
+
+def measure_preset(browser, preset, url, iterations, explicit_timeout):
+    """
+    Launches one browser with a preset and measures time-to-interactive of the home page.
+
+    Time-to-interactive is the wall time from driver.get until the Revenue Calculator button is
+    clickable, which is the point where the flow can continue.
+
+    Args:
+        browser (str): Browser name passed to DriverBase.
+        preset (str): Browser profile preset.
+        url (str): The page to load.
+        iterations (int): Number of page loads.
+        explicit_timeout (int): Timeout of the clickable wait, in seconds.
+
+    Returns:
+        dict: launch time, p50/p95 time-to-interactive and median domInteractive, in seconds.
+    """
+    db = DriverBase(browser)
+    started = time.perf_counter()
+    driver = db.launch(preset)
+    launch_seconds = time.perf_counter() - started
+    page = DriverUtilitiesMethod(driver=driver, explicit_timeout=explicit_timeout)
+
+    interactive, dom_interactive = [], []
+    try:
+        for _ in range(iterations):
+            driver.get('about:blank')
+            started = time.perf_counter()
+            driver.get(url)
+            page.explicitly_wait_till_element_is_clickable(Hpl.revenue_calculator_btn)
+            interactive.append(time.perf_counter() - started)
+            timing = driver.execute_script(_NAVIGATION_TIMING_SCRIPT)
+            if timing[0] is not None:
+                dom_interactive.append(timing[0] / 1000)
+    finally:
+        driver.quit()
+
+    return {
+        'launch': launch_seconds,
+        'p50': percentile(interactive, 0.50),
+        'p95': percentile(interactive, 0.95),
+        'dom_interactive': percentile(dom_interactive, 0.50) if dom_interactive else None,
+        'iterations': iterations,
+    }
+
+
+def main_profile_benchmark():
+    """
+    Measures time-to-interactive of every browser profile preset from the command line.
+    """
+    cd = ConfigData()
+    parser = argparse.ArgumentParser(description='Compare time-to-interactive of the browser profile presets')
+    parser.add_argument('--url', default=cd.web_url, help='Page to load')
+    parser.add_argument('--browser', default='Chrome', help='Browser to launch')
+    parser.add_argument('--presets', nargs='+', default=list(PRESETS), choices=list(PRESETS), help='Presets to compare')
+    parser.add_argument('--iterations', type=int, default=10, help='Page loads per preset')
+    parser.add_argument('--output', default=None, help='Write the results to this JSON file')
+    args = parser.parse_args()
+
+    results = {}
+    for preset in args.presets:
+        results[preset] = result = measure_preset(args.browser, preset, args.url, args.iterations, cd.explicit_timeout)
+        dom_interactive = f"{result['dom_interactive']:.3f}s" if result['dom_interactive'] is not None else 'n/a'
+        print(f"{preset}: launch {result['launch']:.2f}s, interactive p50 {result['p50']:.3f}s, "
+              f"p95 {result['p95']:.3f}s, domInteractive {dom_interactive}")
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == '__main__':
+    main_profile_benchmark()
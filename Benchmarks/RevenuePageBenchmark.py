@@ -0,0 +1,199 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CommonUtilities.DriverBaseUtilities import DriverBase  # noqa: E402
+from CommonUtilities.DriverProfiler import DriverProfiler  # noqa: E402
+from App.HomePageFunctions import HomePageFunctions  # noqa: E402
+from App.RevenuePageFunctions import RevenuePageFunction  # noqa: E402
+from App.AutomationFlow import expected_total_for  # noqa: E402
+from ConfigData.ConfigData import ConfigData  # noqa: E402
+import main  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# The fixture's illustrative reimbursement rates (see RATES in fixtures/revenue_calculator.html)
+FIXTURE_CPT_RATES = {'99091': 48, '99453': 19, '99454': 64, '99474': 15, '99457': 32, '99458': 26, '99473': 16, '99490': 64}
+
+
+def fixture_config(url):
+    """
+    Returns a ConfigData for the fixture: its URL, and totals computed from the fixture's own rates.
+    """
+    cd = ConfigData()
+    cd.web_url = url
+    cd.expected_total = None
+    cd.cpt_reimbursement_rates = FIXTURE_CPT_RATES
+    return cd
+
+
+def serve_fixtures():
+    """
+    Serves the fixture directory from a local HTTP server on a free port.
+
+    Returns:
+        tuple: (server, base URL). Call server.shutdown() when done.
+    """
+    handler = partial(SimpleHTTPRequestHandler, directory=FIXTURE_DIR)
+    handler.log_message = lambda *args: None
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}/revenue_calculator.html'
+
+
+def percentile(samples, fraction):
+    """
+    Returns the nearest-rank percentile of a list of samples.
+    """
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+def summarize(durations, round_trips):
+    """
+    Reduces per-iteration samples to the figures stored in the baseline.
+    """
+    return {
+        'p50': percentile(durations, 0.50),
+        'p95': percentile(durations, 0.95),
+        'mean': statistics.mean(durations),
+        'round_trips': statistics.median(round_trips),
+        'iterations': len(durations),
+    }
+
+
+def benchmark_page_functions(url, iterations):
+    """
+    Times each page function on one browser, reloading the fixture before every iteration.
+
+    Args:
+        url (str): The fixture URL.
+        iterations (int): Number of iterations.
+
+    Returns:
+        dict: Step name mapped to its summary.
+    """
+    cd = fixture_config(url)
+    db = DriverBase('Chrome')
+    driver = db.initiate_driver(db.headless_options())
+    profiler = DriverProfiler()
+    profiler.attach_driver(driver)
+    homepage = HomePageFunctions(driver=driver, explicit_timeout=cd.explicit_timeout)
+    revenue_page = RevenuePageFunction(driver=driver, explicit_timeout=cd.explicit_timeout, use_element_cache=True)
+
+    steps = [
+        ('click_revenue_calculator_btn', homepage.click_revenue_calculator_btn),
+        ('move_and_check_slider_by_value',
+         lambda: revenue_page.move_and_check_slider_by_value(value=cd.slider_value_to_move)),
+        ('fill_and_check_value_in_slider_input',
+         lambda: revenue_page.fill_and_check_value_in_slider_input(value=cd.slider_value_to_fill)),
+        ('select_cpts', lambda: revenue_page.select_cpts(cd.cpt_list_to_select)),
+        ('check_revenue_page_state',
+         lambda: revenue_page.check_revenue_page_state(slider_value=cd.slider_value_to_fill,
+                                                       cpt_list=cd.cpt_list_to_select,
+                                                       expected_total=expected_total_for(cd))),
+    ]
+    samples = {name: ([], []) for name, _ in steps}
+    try:
+        for _ in range(iterations):
+            homepage.navigate_to_url(url)
+            for name, step in steps:
+                commands_before = len(profiler.records)
+                started = time.perf_counter()
+                step()
+                samples[name][0].append(time.perf_counter() - started)
+                samples[name][1].append(len(profiler.records) - commands_before)
+    finally:
+        driver.quit()
+    return {name: summarize(*samples[name]) for name, _ in steps}
+
+
+def benchmark_full_flow(url, iterations):
+    """
+    Times main.browser_automation end to end against the fixture, browser launch included. The browser
+    is launched headless, like the page function benchmark.
+
+    Args:
+        url (str): The fixture URL.
+        iterations (int): Number of iterations.
+
+    Returns:
+        dict: The summary of the full flow.
+
+    Raises:
+        RuntimeError: If a run fails, so a failed run is never timed into the results or the baseline.
+    """
+    durations, round_trips = [], []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for iteration in range(iterations):
+            cd = fixture_config(url)
+            cd.profile_output = os.path.join(work_dir, f'run_{iteration}')
+            cd.browser_profile = 'headless'
+            started = time.perf_counter()
+            passed = main.browser_automation(cd)
+            elapsed = time.perf_counter() - started
+            if not passed:
+                raise RuntimeError(f"browser_automation failed in iteration {iteration + 1}")
+            durations.append(elapsed)
+            with open(f'{cd.profile_output}.json') as profile:
+                round_trips.append(json.load(profile)['summary']['command_count'])
+    return summarize(durations, round_trips)
+
+
+def compare(results, baseline):
+    """
+    Prints each result next to the baseline with the relative change of p50 and p95.
+    """
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            print(f"{name}: no baseline")
+            continue
+        print(f"{name}: p50 {result['p50']:.3f}s ({result['p50'] / reference['p50'] - 1:+.1%}), "
+              f"p95 {result['p95']:.3f}s ({result['p95'] / reference['p95'] - 1:+.1%}), "
+              f"round trips {result['round_trips']} (baseline {reference['round_trips']})")
+
+
+def main_benchmark():
+    """
+    Runs the benchmark suite from the command line.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark page functions against the local revenue calculator fixture')
+    parser.add_argument('--iterations', type=int, default=20, help='Iterations per benchmark')
+    parser.add_argument('--flow-iterations', type=int, default=5, help='Iterations of the full browser_automation flow')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline file to compare against or save to')
+    parser.add_argument('--save-baseline', action='store_true', help='Save these results as the new baseline')
+    args = parser.parse_args()
+
+    server, url = serve_fixtures()
+    try:
+        results = benchmark_page_functions(url, args.iterations)
+        if args.flow_iterations:
+            results['browser_automation'] = benchmark_full_flow(url, args.flow_iterations)
+    finally:
+        server.shutdown()
+
+    for name, result in results.items():
+        print(f"{name}: p50 {result['p50']:.3f}s, p95 {result['p95']:.3f}s, round trips {result['round_trips']}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as output:
+            json.dump(results, output, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as baseline:
+            compare(results, json.load(baseline))
+
+
+if __name__ == '__main__':
+    main_benchmark()
@@ -0,0 +1,392 @@
+import asyncio
+import time
+import aiohttp
+from selenium.common import exceptions
+from CommonUtilities.DriverFunctionUtilities import (DriverUtilitiesMethod, _BULK_QUERY_SCRIPT, _OBSERVER_WAIT_SCRIPT,
+                                                     is_document_unloaded)
+
+# Key of W3C web element references in JSON payloads
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+# W3C error codes mapped to the Selenium exceptions the synchronous helpers raise
+_ERRORS = {
+    'no such element': exceptions.NoSuchElementException,
+    'stale element reference': exceptions.StaleElementReferenceException,
+    'element click intercepted': exceptions.ElementClickInterceptedException,
+    'element not interactable': exceptions.ElementNotInteractableException,
+    'invalid selector': exceptions.InvalidSelectorException,
+    'invalid session id': exceptions.InvalidSessionIdException,
+    'no such window': exceptions.NoSuchWindowException,
+    'script timeout': exceptions.TimeoutException,
+    'timeout': exceptions.TimeoutException,
+    'javascript error': exceptions.JavascriptException,
+}
+
+
+def element_id(reference):
+    """
+    Returns the element id of a W3C web element reference.
+    """
+    return reference[ELEMENT_KEY]
+
+
+class AsyncWebDriverClient:
+    """
+    This class speaks the W3C WebDriver protocol to one endpoint (chromedriver, geckodriver, a Grid)
+    over a shared aiohttp connection pool with keep-alive, so many sessions can be driven
+    concurrently from one event loop.
+    """
+
+    def __init__(self, endpoint, connection_limit=100):
+        """
+        :param endpoint: Base URL of the WebDriver endpoint, e.g. http://127.0.0.1:9515.
+        :param connection_limit: Maximum number of pooled keep-alive connections.
+        """
+        self.endpoint = endpoint.rstrip('/')
+        self.http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=connection_limit, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=None)
+        )
+
+    async def request(self, method, path, payload=None):
+        """
+        Sends one command and returns its value.
+
+        :param method: HTTP method.
+        :param path: Command path below the endpoint.
+        :param payload: JSON body for POST commands.
+        :return: The 'value' member of the response.
+        :raises WebDriverException: The matching Selenium exception for W3C errors.
+        """
+        if method == 'POST' and payload is None:
+            payload = {}
+        async with self.http.request(method, f'{self.endpoint}{path}', json=payload) as response:
+            body = await response.json(content_type=None)
+        value = body.get('value') if isinstance(body, dict) else None
+        if response.status >= 400:
+            error = value.get('error', '') if isinstance(value, dict) else ''
+            message = value.get('message', '') if isinstance(value, dict) else str(body)
+            raise _ERRORS.get(error, exceptions.WebDriverException)(message)
+        return value
+
+    async def new_session(self, capabilities):
+        """
+        Starts a browser session.
+
+        :param capabilities: W3C capabilities, e.g. {'browserName': 'chrome', 'goog:chromeOptions': {...}}.
+        :return: AsyncWebDriverSession for the new session.
+        """
+        value = await self.request('POST', '/session', {'capabilities': {'alwaysMatch': capabilities}})
+        return AsyncWebDriverSession(self, value['sessionId'])
+
+    async def close(self):
+        """
+        Closes the connection pool.
+        """
+        await self.http.close()
+
+
+class AsyncWebDriverSession:
+    """
+    This class wraps the W3C commands of one session used by AsyncDriverUtilitiesMethod.
+    """
+
+    def __init__(self, client, session_id):
+        self.client = client
+        self.session_id = session_id
+        self.script_timeout = None  # Last async script timeout set on the session, shared by its page objects
+        self.commands_sent = 0  # Commands sent on the session so far
+
+    def command(self, method, path='', payload=None):
+        """
+        Sends a command scoped to this session.
+        """
+        self.commands_sent += 1
+        return self.client.request(method, f'/session/{self.session_id}{path}', payload)
+
+    def get(self, url):
+        return self.command('POST', '/url', {'url': url})
+
+    def set_window_rect(self, width, height):
+        return self.command('POST', '/window/rect', {'width': int(width), 'height': int(height)})
+
+    def maximize_window(self):
+        return self.command('POST', '/window/maximize')
+
+    def set_script_timeout(self, seconds):
+        return self.command('POST', '/timeouts', {'script': int(seconds * 1000)})
+
+    async def find_element(self, by, value):
+        return element_id(await self.command('POST', '/element', {'using': by, 'value': value}))
+
+    async def find_elements(self, by, value):
+        return [element_id(reference)
+                for reference in await self.command('POST', '/elements', {'using': by, 'value': value})]
+
+    def click(self, element):
+        return self.command('POST', f'/element/{element}/click')
+
+    def clear(self, element):
+        return self.command('POST', f'/element/{element}/clear')
+
+    def send_keys(self, element, text):
+        return self.command('POST', f'/element/{element}/value', {'text': text})
+
+    def text(self, element):
+        return self.command('GET', f'/element/{element}/text')
+
+    async def attribute(self, element, name):
+        """
+        Mirrors WebElement.get_attribute: the property if it is set, otherwise the attribute.
+        """
+        value = await self.command('GET', f'/element/{element}/property/{name}')
+        if value is None:
+            value = await self.command('GET', f'/element/{element}/attribute/{name}')
+        return None if value is None else str(value)
+
+    def execute_script(self, script, *args):
+        return self.command('POST', '/execute/sync', {'script': script, 'args': list(args)})
+
+    def execute_async_script(self, script, *args):
+        return self.command('POST', '/execute/async', {'script': script, 'args': list(args)})
+
+    def perform_actions(self, actions):
+        return self.command('POST', '/actions', {'actions': actions})
+
+    def quit(self):
+        return self.command('DELETE')
+
+
+class AsyncDriverUtilitiesMethod:
+    """
+    Async counterpart of DriverUtilitiesMethod with the same helper names and locator handling.
+    Every helper is a coroutine, so the event loop drives other sessions while one is waiting.
+    """
+
+    def __init__(self, session, explicit_timeout):
+        """
+        :param session: AsyncWebDriverSession for interacting with the browser.
+        :param explicit_timeout: Time in seconds for explicit waits.
+        """
+        self.driver = session
+        self.explicit_timeout = explicit_timeout
+
+    _resolve_locator = staticmethod(DriverUtilitiesMethod._resolve_locator)
+
+    async def navigate_to_url(self, url):
+        """
+        Navigates the browser to the given URL.
+
+        :param url: URL to navigate to.
+        """
+        await self.driver.get(url)
+
+    async def set_browser_window_size(self, width=0, height=0):
+        """
+        Sets the size of the browser window. If no size is given, it maximizes the window.
+
+        :param width: Width of the window.
+        :param height: Height of the window.
+        """
+        if not width or not height:
+            await self.driver.maximize_window()
+        else:
+            await self.driver.set_window_rect(width=width, height=height)
+
+    async def _ensure_script_timeout(self, timeout):
+        """
+        Raises the session's async script timeout so that it outlasts an in-page timer of the given length.
+        The timeout is tracked on the session and only ever raised, as in DriverUtilitiesMethod.
+        """
+        if self.driver.script_timeout is None or self.driver.script_timeout < timeout + 1:
+            self.driver.script_timeout = timeout + 1
+            await self.driver.set_script_timeout(self.driver.script_timeout)
+
+    async def _wait_for(self, condition, element_locator, find_by, explicit_wait_multiplier):
+        """
+        Waits in the page (MutationObserver) until the element reaches the condition.
+
+        :param condition: 'presence', 'visibility', 'invisibility' or 'clickable'.
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
+        :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
+        """
+        timeout = self.explicit_timeout * explicit_wait_multiplier
+        await self._ensure_script_timeout(timeout)
+        locator_method, locator_value = self._resolve_locator(element_locator, find_by)
+        strategy = 'xpath' if locator_method == 'xpath' else 'css'
+        deadline = time.perf_counter() + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            try:
+                satisfied = remaining > 0 and await self.driver.execute_async_script(
+                    _OBSERVER_WAIT_SCRIPT, locator_value, strategy, condition, int(remaining * 1000))
+                break
+            except exceptions.JavascriptException as e:
+                # A navigation unloaded the watcher with the page; re-arm it on the new document
+                if not is_document_unloaded(e):
+                    raise
+        if not satisfied:
+            raise exceptions.TimeoutException(f"Element {locator_value} not {condition} after {timeout}s")
+
+    async def explicitly_wait_till_presence_of_element_located(self, element_locator, find_by="xpath", explicit_wait_multiplier=1):
+        """
+        Waits until the element is present in the DOM.
+        """
+        await self._wait_for('presence', element_locator, find_by, explicit_wait_multiplier)
+
+    async def explicitly_wait_till_visibility_of_element_located(self, element_locator, find_by="xpath", explicit_wait_multiplier=1):
+        """
+        Waits until the element is visible on the page.
+        """
+        await self._wait_for('visibility', element_locator, find_by, explicit_wait_multiplier)
+
+    async def explicitly_wait_till_invisibility_of_element_located(self, element_locator, find_by="xpath", explicit_wait_multiplier=1):
+        """
+        Waits until the element is no longer visible.
+        """
+        await self._wait_for('invisibility', element_locator, find_by, explicit_wait_multiplier)
+
+    async def explicitly_wait_till_element_is_clickable(self, element_locator, find_by="xpath", explicit_wait_multiplier=1):
+        """
+        Waits until the element is clickable.
+        """
+        await self._wait_for('clickable', element_locator, find_by, explicit_wait_multiplier)
+
+    async def _find_element(self, element_locator, find_by, explicit_wait_multiplier, wait_method):
+        """
+        Waits with wait_method and returns the element id.
+        """
+        await wait_method(element_locator, find_by, explicit_wait_multiplier)
+        return await self.driver.find_element(*self._resolve_locator(element_locator, find_by))
+
+    async def is_element_present(self, element_locator, find_by="xpath") -> bool:
+        """
+        Checks in a single round trip, without waiting, whether the element is in the DOM.
+        """
+        return bool(await self.driver.find_elements(*self._resolve_locator(element_locator, find_by)))
+
+    async def scroll_to_element(self, element_locator, find_by="xpath", explicit_wait_multiplier=1):
+        """
+        Scrolls the page until the specified element is in view.
+        """
+        element = await self._find_element(element_locator, find_by, explicit_wait_multiplier,
+                                           self.explicitly_wait_till_presence_of_element_located)
+        await self.driver.execute_script("arguments[0].scrollIntoView();", {ELEMENT_KEY: element})
+
+    async def click_element(self, element_locator, find_by="xpath", explicit_wait_multiplier=1):
+        """
+        Clicks the element after waiting for it to be clickable.
+        """
+        element = await self._find_element(element_locator, find_by, explicit_wait_multiplier,
+                                           self.explicitly_wait_till_element_is_clickable)
+        await self.driver.click(element)
+
+    async def input_text_in_field(self, element_locator, text, find_by="xpath", clear=False, explicit_wait_multiplier=1):
+        """
+        Enters text into an input field.
+        """
+        element = await self._find_element(element_locator, find_by, explicit_wait_multiplier,
+                                           self.explicitly_wait_till_presence_of_element_located)
+        if clear:
+            await self.driver.clear(element)
+        await self.driver.send_keys(element, text)
+
+    async def get_text(self, element_locator, find_by="xpath", explicit_wait_multiplier=1) -> str:
+        """
+        Retrieves the text of the element.
+        """
+        element = await self._find_element(element_locator, find_by, explicit_wait_multiplier,
+                                           self.explicitly_wait_till_visibility_of_element_located)
+        return await self.driver.text(element)
+
+    async def move_slider(self, element_locator, x_value=1, y_value=1, find_by="xpath", explicit_wait_multiplier=1):
+        """
+        Moves the slider element by a given offset with a press-move-release pointer sequence.
+        """
+        element = await self._find_element(element_locator, find_by, explicit_wait_multiplier,
+                                           self.explicitly_wait_till_visibility_of_element_located)
+        await self.drag_element_by_offset(element, x_value, y_value)
+
+    async def drag_element_by_offset(self, element, x_value, y_value):
+        """
+        Drags an element (by id) from its centre by the given offset in one actions request.
+        """
+        await self.driver.perform_actions([{
+            'type': 'pointer', 'id': 'mouse', 'parameters': {'pointerType': 'mouse'},
+            'actions': [
+                {'type': 'pointerMove', 'duration': 0, 'origin': {ELEMENT_KEY: element}, 'x': 0, 'y': 0},
+                {'type': 'pointerDown', 'button': 0},
+                {'type': 'pointerMove', 'duration': 250, 'origin': 'pointer', 'x': int(x_value), 'y': int(y_value)},
+                {'type': 'pointerUp', 'button': 0},
+            ],
+        }])
+
+    async def get_attribute_value_of_element(self, element_locator, attribute_name, find_by="xpath", explicit_wait_multiplier=1):
+        """
+        Retrieves the value of an attribute of an element.
+        """
+        element = await self._find_element(element_locator, find_by, explicit_wait_multiplier,
+                                           self.explicitly_wait_till_visibility_of_element_located)
+        return await self.driver.attribute(element, attribute_name)
+
+    async def fill_text_using_action_chain(self, element_locator, text, find_by="xpath", explicit_wait_multiplier=1, clear=False):
+        """
+        Clicks the input field and types the text as key actions, in one actions request.
+        """
+        element = await self._find_element(element_locator, find_by, explicit_wait_multiplier,
+                                           self.explicitly_wait_till_presence_of_element_located)
+        if clear:
+            await self.driver.clear(element)
+        await self.driver.perform_actions([
+            {'type': 'pointer', 'id': 'mouse', 'parameters': {'pointerType': 'mouse'}, 'actions': [
+                {'type': 'pointerMove', 'duration': 0, 'origin': {ELEMENT_KEY: element}, 'x': 0, 'y': 0},
+                {'type': 'pointerDown', 'button': 0},
+                {'type': 'pointerUp', 'button': 0},
+            ]},
+            # Three pauses keep the key strokes after the move/press/release ticks of the click
+            {'type': 'key', 'id': 'keyboard', 'actions': [{'type': 'pause', 'duration': 0}] * 3 + [
+                {'type': key_type, 'value': key} for key in text for key_type in ('keyDown', 'keyUp')
+            ]},
+        ])
+
+    async def press_keyboard_key(self, key):
+        """
+        Simulates pressing a keyboard key.
+        """
+        await self.driver.perform_actions([{'type': 'key', 'id': 'keyboard', 'actions': [
+            {'type': 'keyDown', 'value': key}, {'type': 'keyUp', 'value': key},
+        ]}])
+
+    async def query_elements(self, queries: dict, find_by="xpath") -> dict:
+        """
+        Reads values from several elements in a single execute_script round trip (see DriverUtilitiesMethod).
+        """
+        batch = []
+        for name, query in queries.items():
+            read = query[1]
+            if read not in ("text", "attribute", "checked", "rect"):
+                raise ValueError(f"Unsupported read '{read}' for query '{name}'")
+            locator_method, locator_value = self._resolve_locator(query[0], find_by)
+            attribute_name = query[2] if read == "attribute" else None
+            batch.append([name, locator_value, 'xpath' if locator_method == 'xpath' else 'css', read, attribute_name])
+        return await self.driver.execute_script(_BULK_QUERY_SCRIPT, batch)
+
+
+async def run_concurrently(coroutines, limit):
+    """
+    Awaits coroutines with at most `limit` running at once.
+
+    :return: List of (result, seconds) tuples in input order; a raised exception takes the place of the result.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def limited(coroutine):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                return await coroutine, time.perf_counter() - started
+            except Exception as e:
+                return e, time.perf_counter() - started
+
+    return await asyncio.gather(*(limited(coroutine) for coroutine in coroutines))
@@ -0,0 +1,112 @@
+from selenium import webdriver
+
+# URL patterns of resources the flow never needs: images, fonts, video and third-party analytics
+BLOCKED_URL_PATTERNS = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mov',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+    '*hotjar.com*', '*clarity.ms*', '*hubspot.com*', '*hs-scripts.com*', '*linkedin.com/px*',
+)
+
+# Launch presets. Each one sets:
+#   headless      - run without a visible window
+#   page_load     - page load strategy ('normal' waits for the load event, 'eager' for DOMContentLoaded)
+#   window_size   - (width, height) applied at launch, or None to keep the browser default
+#   block         - block BLOCKED_URL_PATTERNS and image loading
+PRESETS = {
+    'default': {'headless': False, 'page_load': 'normal', 'window_size': None, 'block': False},
+    'headless': {'headless': True, 'page_load': 'normal', 'window_size': (1920, 1080), 'block': False},
+    'eager': {'headless': True, 'page_load': 'eager', 'window_size': (1920, 1080), 'block': False},
+    'lean': {'headless': True, 'page_load': 'eager', 'window_size': (1920, 1080), 'block': True},
+}
+
+
+def preset_settings(preset, **overrides):
+    """
+    Returns the settings of a preset with individual settings overridden.
+
+    Args:
+        preset (str): One of PRESETS.
+        **overrides: Any of headless, page_load, window_size or block.
+
+    Returns:
+        dict: The settings.
+    """
+    if preset not in PRESETS:
+        raise ValueError(f"Unknown browser profile '{preset}', expected one of {', '.join(PRESETS)}")
+    settings = dict(PRESETS[preset])
+    for name, value in overrides.items():
+        if name not in settings:
+            raise ValueError(f"Unknown browser profile setting '{name}'")
+        settings[name] = value
+    return settings
+
+
+def build_options(browser, preset='lean', arguments=(), **overrides):
+    """
+    Builds launch options for Chrome, Firefox or Edge from a preset.
+
+    URL-pattern blocking of Chrome and Edge happens after launch (see apply_url_blocking); at launch
+    only image loading is switched off. Firefox has no pattern blocking and blocks images, document
+    fonts and autoplaying media through preferences instead.
+
+    Args:
+        browser (str): chrome, firefox, or edge.
+        preset (str): One of PRESETS.
+        arguments (iterable): Extra command-line arguments for the browser, e.g. ReplayServer.chrome_arguments().
+        **overrides: Individual settings overriding the preset.
+
+    Returns:
+        Options object for the browser.
+    """
+    settings = preset_settings(preset, **overrides)
+    browser = browser.lower()
+    width, height = settings['window_size'] or (None, None)
+
+    if browser == 'firefox':
+        options = webdriver.FirefoxOptions()
+        if settings['headless']:
+            options.add_argument('-headless')
+        if width:
+            options.add_argument(f'--width={width}')
+            options.add_argument(f'--height={height}')
+        if settings['block']:
+            options.set_preference('permissions.default.image', 2)
+            options.set_preference('browser.display.use_document_fonts', 0)
+            options.set_preference('media.autoplay.default', 5)
+    elif browser in ('chrome', 'edge'):
+        options = webdriver.ChromeOptions() if browser == 'chrome' else webdriver.EdgeOptions()
+        if settings['headless']:
+            options.add_argument('--headless=new')
+        if width:
+            options.add_argument(f'--window-size={width},{height}')
+        if settings['block']:
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    else:
+        raise ValueError(f"Currently {browser} driver is not supported")
+
+    for argument in arguments:
+        options.add_argument(argument)
+    options.page_load_strategy = settings['page_load']
+    return options
+
+
+def apply_url_blocking(driver, browser, preset='lean', **overrides):
+    """
+    Blocks BLOCKED_URL_PATTERNS on a launched Chrome or Edge session through the DevTools protocol.
+
+    Args:
+        driver: WebDriver instance launched with build_options.
+        browser (str): chrome, firefox, or edge.
+        preset (str): The preset the driver was launched with.
+        **overrides: The overrides the driver was launched with.
+
+    Returns:
+        bool: True if the patterns were installed.
+    """
+    if not preset_settings(preset, **overrides)['block'] or browser.lower() not in ('chrome', 'edge'):
+        return False
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(BLOCKED_URL_PATTERNS)})
+    return True
@@ -1,39 +1,123 @@
+import importlib
 import os
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.edge.service import Service as EdgeService
+from CommonUtilities.DriverBinaryCache import DriverBinaryCache
+from CommonUtilities.BrowserProfiles import build_options, apply_url_blocking, preset_settings
 import sys
 
 
 class DriverBase:
     """
     This class is responsible for initiating and managing web driver instances
-    for different browsers (Chrome, Firefox, and Edge). It uses the
-    `webdriver_manager` package to automatically download the appropriate
-    driver executables.
+    for different browsers (Chrome, Firefox, and Edge). Driver executables are
+    resolved through a persistent manifest (DriverBinaryCache) keyed by the
+    installed browser version; only on a cache miss does it fall back to a
+    configured path, the `webdriver_manager` package or Selenium Manager.
     """
 
-    def __init__(self, browser):
+    # webdriver class, Service class and webdriver_manager (module, class) for each supported browser
+    browsers = {
+        'chrome': (webdriver.Chrome, ChromeService, ('webdriver_manager.chrome', 'ChromeDriverManager')),
+        'firefox': (webdriver.Firefox, FirefoxService, ('webdriver_manager.firefox', 'GeckoDriverManager')),
+        'edge': (webdriver.Edge, EdgeService, ('webdriver_manager.microsoft', 'EdgeChromiumDriverManager')),
+    }
+
+    def __init__(self, browser, driver_path=None, manifest_path=None):
         """
         Initializes the browser for automation.
 
         Args:
             browser (str): The browser name (chrome, firefox, or edge) that
                            specifies which browser to use for automation.
+            driver_path (str): Driver binary to use on a cache miss. Defaults to the
+                               'driver_path' environment variable, if set.
+            manifest_path (str): Location of the driver resolution manifest.
         """
         # Set the selected browser in the environment variable 'driver_to'
         os.environ['driver_to'] = browser
         self.driver_run = os.environ['driver_to']  # Store the browser type for future reference
+        self.driver_path = driver_path or os.environ.get('driver_path')
+        self.binary_cache = DriverBinaryCache(manifest_path)
+
+    def headless_options(self, width=1920, height=1080):
+        """
+        Builds options that launch the selected browser headless with a fixed window size.
+
+        Args:
+            width (int): Window width in pixels.
+            height (int): Window height in pixels.
+
+        Returns:
+            Options object for the selected browser, or None if the browser is unsupported.
+        """
+        if self.driver_run.lower() not in self.browsers:
+            return None
+        return build_options(self.driver_run, 'headless', window_size=(width, height))
+
+    def launch(self, preset='lean', arguments=(), **overrides):
+        """
+        Launches the selected browser with a browser profile preset (see CommonUtilities.BrowserProfiles).
+
+        The options come from build_options; on Chrome and Edge the preset's URL blocking is installed
+        right after launch, before the first navigation. The settings are recorded on the driver as
+        driver.browser_profile, so the flow can skip resizing a window already launched at its size.
+
+        Args:
+            preset (str): default, headless, eager or lean.
+            arguments (iterable): Extra command-line arguments for the browser.
+            **overrides: Individual settings overriding the preset (headless, page_load, window_size, block).
+
+        Returns:
+            webdriver instance: A Selenium WebDriver object for the selected browser.
+        """
+        if self.driver_run.lower() not in self.browsers:
+            # Let initiate_driver report the unsupported browser
+            return self.initiate_driver()
+        driver = self.initiate_driver(build_options(self.driver_run, preset, arguments, **overrides))
+        apply_url_blocking(driver, self.driver_run, preset, **overrides)
+        driver.browser_profile = preset_settings(preset, **overrides)
+        return driver
+
+    def resolve_driver_path(self, browser):
+        """
+        Resolves the driver binary on a manifest cache miss.
+
+        The configured driver_path wins. Otherwise the `webdriver_manager` manager for the
+        selected browser is imported and installed, if that package is available. If neither
+        applies, or the install fails (it downloads the driver, e.g. on a runner without network
+        access), None is returned and Selenium Manager resolves the driver when the service starts,
+        from PATH or its own cache.
+
+        Args:
+            browser (str): chrome, firefox, or edge.
+
+        Returns:
+            str: The driver binary path, or None to let Selenium Manager resolve it.
+        """
+        if self.driver_path:
+            return self.driver_path
+        module_name, manager_name = self.browsers[browser][2]
+        try:
+            manager = getattr(importlib.import_module(module_name), manager_name)
+        except ImportError:
+            return None
+        try:
+            return manager().install()
+        except Exception as e:
+            print(f"webdriver_manager could not install the {browser} driver ({e}), falling back to Selenium Manager")
+            return None
 
     def initiate_driver(self, option=None):
         """
         Initializes the web driver based on the selected browser.
 
-        The function attempts to launch the selected browser with the given options.
-        If no driver is found, it will attempt to download the appropriate driver
-        using the `webdriver_manager` package.
+        The function attempts to launch the selected browser with the given options,
+        using the driver binary recorded in the manifest for the installed browser
+        version. On a cache miss the driver is resolved with resolve_driver_path and
+        recorded for later launches.
 
         Args:
             option: Additional options for the web driver (e.g., headless mode, custom preferences).
@@ -44,26 +128,34 @@ class DriverBase:
         Raises:
             SystemExit: If the selected browser is unsupported, the program will exit.
         """
+        browser = self.driver_run.lower()
+        if browser not in self.browsers:
+            # If the browser is not supported, print a message and exit
+            print(f"Currently {self.driver_run} driver is not supported")
+            sys.exit(2)
+
         try:
-            # If Chrome is selected
-            if self.driver_run.lower() == 'chrome':
-                # Try to initialize with service (recommended for newer versions)
-                driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=option)
-
-            # If Firefox is selected
-            elif self.driver_run.lower() == 'firefox':
-                # Try to initialize with service (recommended for newer versions)
-                driver = webdriver.Firefox(service=Service(GeckoDriverManager().install()), options=option)
-
-            # If Edge is selected
-            elif self.driver_run.lower() == 'edge':
-                # Try to initialize with service (recommended for newer versions)
-                driver = webdriver.Edge(service=Service(EdgeChromiumDriverManager().install()), options=option)
-
-            else:
-                # If the browser is not supported, print a message and exit
-                print(f"Currently {self.driver_run} driver is not supported")
-                sys.exit(2)
+            driver_class, service_class, _ = self.browsers[browser]
+            version = self.binary_cache.browser_version(browser)
+
+            # Launch with the cached driver binary; a stale entry is dropped and resolved again
+            cached_path = self.binary_cache.lookup(browser, version)
+            if cached_path:
+                try:
+                    return driver_class(service=service_class(cached_path), options=option)
+                except Exception:
+                    self.binary_cache.forget(browser, version)
+
+            # Cache miss: resolve the driver once, then record it for the following launches
+            driver_path = self.resolve_driver_path(browser)
+            driver = driver_class(service=service_class(driver_path), options=option)
+            resolved_path = driver_path or getattr(driver.service, 'path', None)
+            if resolved_path and os.path.isfile(resolved_path):
+                try:
+                    self.binary_cache.store(browser, version, resolved_path)
+                except OSError as e:
+                    # The driver is running; a manifest that cannot be written only costs the next launch a lookup
+                    print(f"Could not update the driver manifest: {e}")
 
             return driver  # Return the initialized driver
 
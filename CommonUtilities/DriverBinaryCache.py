@@ -0,0 +1,144 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+class DriverBinaryCache:
+    """
+    This class keeps a persistent manifest mapping a browser and its installed version to the driver
+    binary that was resolved for it, so that later launches can find the driver without any network access.
+    """
+
+    # Executables (or absolute paths) that report the installed browser version with --version
+    browser_commands = {
+        'chrome': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome',
+                   '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+        'firefox': ['firefox', '/Applications/Firefox.app/Contents/MacOS/firefox'],
+        'edge': ['microsoft-edge', 'microsoft-edge-stable', 'msedge',
+                 '/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge'],
+    }
+
+    # Registry keys holding the installed version on Windows
+    windows_registry_keys = {
+        'chrome': r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon',
+        'edge': r'HKEY_CURRENT_USER\Software\Microsoft\Edge\BLBeacon',
+        'firefox': r'HKEY_LOCAL_MACHINE\SOFTWARE\Mozilla\Mozilla Firefox',
+    }
+
+    def __init__(self, manifest_path=None):
+        """
+        Loads the manifest.
+
+        Args:
+            manifest_path (str): Location of the manifest file. Defaults to ~/.cache/fitpeo/driver_manifest.json.
+        """
+        self.manifest_path = manifest_path or os.path.join(
+            os.path.expanduser('~'), '.cache', 'fitpeo', 'driver_manifest.json'
+        )
+        try:
+            with open(self.manifest_path) as manifest:
+                self.entries = json.load(manifest)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def browser_version(self, browser):
+        """
+        Detects the installed browser version locally, without network access.
+
+        Args:
+            browser (str): chrome, firefox, or edge.
+
+        Returns:
+            str: The version string, or 'unknown' if it could not be detected.
+        """
+        commands = []
+        if sys.platform.startswith('win') and browser in self.windows_registry_keys:
+            commands.append(['reg', 'query', self.windows_registry_keys[browser], '/v',
+                             'CurrentVersion' if browser == 'firefox' else 'version'])
+        for executable in self.browser_commands.get(browser, []):
+            path = executable if os.path.isabs(executable) else shutil.which(executable)
+            if path and os.path.exists(path):
+                commands.append([path, '--version'])
+
+        for command in commands:
+            try:
+                output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+            match = re.search(r'\d+(\.\d+)+', output)
+            if match:
+                return match.group(0)
+        return 'unknown'
+
+    @staticmethod
+    def _key(browser, version):
+        return f'{browser}:{version}'
+
+    def lookup(self, browser, version):
+        """
+        Returns the cached driver path if it still exists, is executable and has the recorded size.
+
+        Args:
+            browser (str): chrome, firefox, or edge.
+            version (str): The installed browser version.
+
+        Returns:
+            str: The driver path, or None on a cache miss.
+        """
+        entry = self.entries.get(self._key(browser, version))
+        if not entry:
+            return None
+        path = entry['path']
+        try:
+            if os.access(path, os.X_OK) and os.path.getsize(path) == entry['size']:
+                return path
+        except OSError:
+            pass
+        self.forget(browser, version)
+        return None
+
+    def store(self, browser, version, path):
+        """
+        Records the driver path for a browser version and saves the manifest.
+
+        Args:
+            browser (str): chrome, firefox, or edge.
+            version (str): The installed browser version.
+            path (str): The driver binary path.
+        """
+        self.entries[self._key(browser, version)] = {'path': path, 'size': os.path.getsize(path)}
+        self._save()
+
+    def forget(self, browser, version):
+        """
+        Drops the entry for a browser version, e.g. after the cached driver failed to start. A manifest that
+        cannot be written is left as is; lookup verifies entries anyway.
+        """
+        if self.entries.pop(self._key(browser, version), None) is not None:
+            try:
+                self._save()
+            except OSError:
+                pass
+
+    def _save(self):
+        """
+        Writes the manifest atomically. Each write goes through its own temporary file, so processes
+        launching drivers at the same time (e.g. the ScenarioRunner pool) do not replace each other's file.
+        """
+        directory = os.path.dirname(self.manifest_path)
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix='.driver_manifest.', suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w') as manifest:
+                json.dump(self.entries, manifest, indent=2)
+            os.replace(temporary_path, self.manifest_path)
+        except BaseException:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+            raise
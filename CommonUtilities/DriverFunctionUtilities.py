@@ -2,19 +2,282 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, JavascriptException
+import time
+import weakref
+from contextlib import contextmanager
+from Locators.LocatorRegistry import Locator
+
+# Resolves a batch of locators and reads the requested value from each in one round trip.
+# arguments[0] is a list of [name, locator, strategy, read, attribute_name] entries.
+_BULK_QUERY_SCRIPT = """
+var result = {};
+arguments[0].forEach(function (query) {
+    var name = query[0], locator = query[1], strategy = query[2], read = query[3], attribute = query[4];
+    var element = strategy === 'xpath'
+        ? document.evaluate(locator, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(locator);
+    if (!element) {
+        result[name] = null;
+    } else if (read === 'text') {
+        result[name] = element.innerText.trim();
+    } else if (read === 'attribute') {
+        var value = attribute in element ? element[attribute] : element.getAttribute(attribute);
+        result[name] = value === null || value === undefined ? null : String(value);
+    } else if (read === 'checked') {
+        var box = 'checked' in element ? element : element.querySelector('input');
+        result[name] = box ? Boolean(box.checked) : null;
+    } else if (read === 'rect') {
+        var rect = element.getBoundingClientRect();
+        result[name] = {x: rect.left, y: rect.top, width: rect.width, height: rect.height};
+    }
+});
+return result;
+"""
+
+# Resolves as soon as the element reaches the requested state, watching DOM mutations and animation frames.
+# arguments: locator, strategy ('xpath' or 'css'), condition, timeout in milliseconds, async callback.
+_OBSERVER_WAIT_SCRIPT = """
+var locator = arguments[0], strategy = arguments[1], condition = arguments[2], timeout = arguments[3];
+var done = arguments[arguments.length - 1];
+function find() {
+    return strategy === 'xpath'
+        ? document.evaluate(locator, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(locator);
+}
+function visible(element) {
+    if (!element || !element.getClientRects().length) return false;
+    var style = window.getComputedStyle(element);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+}
+function satisfied() {
+    var element = find();
+    if (condition === 'presence') return !!element;
+    if (condition === 'visibility') return visible(element);
+    if (condition === 'clickable') return visible(element) && !element.disabled;
+    return !visible(element);
+}
+var finished = false, observer = null, timer = null;
+function finish(ok) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done(ok);
+}
+if (satisfied()) { finish(true); return; }
+observer = new MutationObserver(function () { if (satisfied()) finish(true); });
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+(function frame() {
+    if (finished) return;
+    if (satisfied()) { finish(true); return; }
+    window.requestAnimationFrame(frame);
+})();
+timer = setTimeout(function () { finish(satisfied()); }, timeout);
+"""
+
+# Waits applied to an element served from the cache, keyed by the wait method that guards the lookup;
+# presence needs no wait since the cached reference exists (staleness is handled on use)
+_CACHE_HIT_CONDITIONS = {
+    'explicitly_wait_till_visibility_of_element_located': EC.visibility_of,
+    'explicitly_wait_till_element_is_clickable': EC.element_to_be_clickable,
+}
+
+# State shared by every page object bound to the same driver session: the element cache and the
+# async script timeout last set on the session
+_session_state = weakref.WeakKeyDictionary()
+
+
+def _shared_state(driver):
+    """
+    Returns the state shared by the page objects of a driver session, creating it on first use.
+    """
+    state = _session_state.get(driver)
+    if state is None:
+        state = _session_state[driver] = {'elements': {}, 'script_timeout': None}
+    return state
+
+
+def is_document_unloaded(error):
+    """
+    Tells whether an async script failed because the page navigated away while it was running.
+    """
+    return isinstance(error, JavascriptException) and 'unloaded' in (error.msg or '').lower()
 
 
 class DriverUtilitiesMethod:
 
-    def __init__(self, driver, explicit_timeout):
+    def __init__(self, driver, explicit_timeout, use_element_cache=False, wait_backend="polling"):
         """
         Initializes the DriverUtilitiesMethod with the given WebDriver instance and explicit wait timeout.
 
         :param driver: WebDriver instance for interacting with the browser.
         :param explicit_timeout: Time in seconds for explicit waits.
+        :param use_element_cache: If True, resolved elements are reused per (By, locator) until they go stale
+                                  or the page changes. The cache belongs to the driver session, so every page
+                                  object on the same driver shares it and any of them can invalidate it.
+        :param wait_backend: 'polling' for WebDriverWait or 'observer' for an in-page MutationObserver watcher.
         """
         self.driver = driver
         self.explicit_timeout = explicit_timeout
+        self.use_element_cache = use_element_cache
+        self.element_cache = _shared_state(driver)['elements']
+        self.element_cache_hits = 0
+        self.element_cache_misses = 0
+        self.wait_backend = wait_backend
+        self.wait_timings = []
+        self._pending_actions = None
+        self._pending_action_count = 0
+
+    def invalidate_element_cache(self):
+        """
+        Drops every cached element of the driver session. Called on navigation and page transitions.
+        """
+        self.element_cache.clear()
+
+    def element_cache_stats(self):
+        """
+        Returns the element cache counters.
+
+        :return: Dictionary with 'hits', 'misses' and 'size' of the element cache.
+        """
+        return {'hits': self.element_cache_hits, 'misses': self.element_cache_misses, 'size': len(self.element_cache)}
+
+    @staticmethod
+    def _resolve_locator(element_locator, find_by):
+        """
+        Returns the Selenium strategy and expression for a locator.
+
+        :param element_locator: A Locator object, or a raw locator string interpreted with find_by.
+        :param find_by: Method to locate raw string locators ('xpath' or 'css').
+        :return: Tuple of (By strategy, locator expression).
+        """
+        if isinstance(element_locator, Locator):
+            return element_locator.by, element_locator.value
+        return By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR, element_locator
+
+    def _find_element(self, element_locator: str, find_by, explicit_wait_multiplier, wait_method):
+        """
+        Returns the element for the locator, waiting with wait_method when it is not cached.
+
+        A cached element still has to meet the wait's condition (visible or clickable) before it is
+        returned, so a hit only saves the lookup, not the state check.
+
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
+        :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
+        :param wait_method: One of the explicitly_wait_till_* methods to run before the lookup.
+        :return: Tuple of (WebElement, True if it was served from the cache).
+        """
+        key = self._resolve_locator(element_locator, find_by)
+        if self.use_element_cache and key in self.element_cache:
+            element = self.element_cache[key]
+            hit_condition = _CACHE_HIT_CONDITIONS.get(getattr(wait_method, '__name__', None))
+            try:
+                if hit_condition:
+                    WebDriverWait(self.driver, self.explicit_timeout * explicit_wait_multiplier).until(
+                        hit_condition(element))
+                self.element_cache_hits += 1
+                return element, True
+            except StaleElementReferenceException:
+                # The page replaced the element; resolve it again below
+                self.element_cache.pop(key, None)
+        wait_method(element_locator, find_by, explicit_wait_multiplier)
+        element = self.driver.find_element(by=key[0], value=key[1])
+        if self.use_element_cache:
+            self.element_cache_misses += 1
+            self.element_cache[key] = element
+        return element, False
+
+    def _run_on_element(self, element_locator: str, find_by, explicit_wait_multiplier, wait_method, action):
+        """
+        Runs action on the element, re-resolving it once if a cached element has gone stale.
+
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
+        :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
+        :param wait_method: One of the explicitly_wait_till_* methods to run before the lookup.
+        :param action: Callable receiving the WebElement.
+        :return: Whatever action returns.
+        """
+        element, cached = self._find_element(element_locator, find_by, explicit_wait_multiplier, wait_method)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            if not cached:
+                raise
+            self.element_cache.pop(self._resolve_locator(element_locator, find_by), None)
+            element, _ = self._find_element(element_locator, find_by, explicit_wait_multiplier, wait_method)
+            return action(element)
+
+    @contextmanager
+    def batch_actions(self):
+        """
+        Queues pointer and key actions from the helpers inside the with-block into one ActionChains.
+
+        The queue is sent as a single W3C Actions request when the block exits, or earlier when a helper
+        needs to read from or otherwise touch the page. If the block raises, actions still queued are discarded.
+        Nested blocks join the outer batch.
+        """
+        if self._pending_actions is not None:
+            yield
+            return
+        self._pending_actions = ActionChains(self.driver)
+        self._pending_action_count = 0
+        try:
+            yield
+            self.flush_actions()
+        finally:
+            self._pending_actions = None
+            self._pending_action_count = 0
+
+    @contextmanager
+    def count_commands(self):
+        """
+        Counts the WebDriver commands sent inside the with-block by wrapping driver.execute, as
+        DriverProfiler.attach_driver does. A wrapper already installed (e.g. the profiler's) stays in place.
+
+        :return: Yields a dict whose 'count' is updated as commands are sent.
+        """
+        counter = {'count': 0}
+        installed = vars(self.driver).get('execute')
+        execute = self.driver.execute
+
+        def counted_execute(driver_command, params=None):
+            counter['count'] += 1
+            return execute(driver_command, params)
+
+        self.driver.execute = counted_execute
+        try:
+            yield counter
+        finally:
+            if installed is None:
+                vars(self.driver).pop('execute', None)
+            else:
+                self.driver.execute = installed
+
+    def flush_actions(self):
+        """
+        Performs the actions queued by batch_actions, if any. Outside a batch this does nothing.
+        """
+        if self._pending_actions is not None and self._pending_action_count:
+            self._pending_actions.perform()
+            self._pending_actions = ActionChains(self.driver)
+            self._pending_action_count = 0
+
+    def _queue_actions(self, build):
+        """
+        Adds actions to the pending batch, or performs them right away when no batch is open.
+
+        :param build: Callable receiving an ActionChains and adding actions to it.
+        """
+        if self._pending_actions is None:
+            actions = ActionChains(self.driver)
+            build(actions)
+            actions.perform()
+        else:
+            build(self._pending_actions)
+            self._pending_action_count += 1
 
     def navigate_to_url(self, url):
         """
@@ -22,8 +285,22 @@ class DriverUtilitiesMethod:
 
         :param url: URL to navigate to.
         """
+        self.flush_actions()
+        self.invalidate_element_cache()
         self.driver.get(url)
 
+    def is_element_present(self, element_locator, find_by="xpath") -> bool:
+        """
+        Checks in a single round trip, without waiting, whether the element is in the DOM.
+
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
+        :return: True if at least one element matches.
+        """
+        self.flush_actions()
+        locator_method, locator_value = self._resolve_locator(element_locator, find_by)
+        return bool(self.driver.find_elements(by=locator_method, value=locator_value))
+
     def set_browser_window_size(self, width=0, height=0):
         """
         Sets the size of the browser window. If no size is given, it maximizes the window.
@@ -31,161 +308,217 @@ class DriverUtilitiesMethod:
         :param width: Width of the window.
         :param height: Height of the window.
         """
+        self.flush_actions()
         if not width or not height:
             self.driver.maximize_window()
         else:
             self.driver.set_window_size(width=width, height=height)
 
+    def _ensure_script_timeout(self, timeout):
+        """
+        Raises the driver's async script timeout so that it outlasts an in-page timer of the given length.
+
+        The timeout is a session setting, so it is tracked per driver and only ever raised: a page object
+        with a shorter wait never cuts the timeout another object on the same session relies on.
+
+        :param timeout: Length in seconds of the in-page timer.
+        """
+        state = _shared_state(self.driver)
+        if state['script_timeout'] is None or state['script_timeout'] < timeout + 1:
+            state['script_timeout'] = timeout + 1
+            self.driver.set_script_timeout(state['script_timeout'])
+
+    def _wait_for(self, condition, expected_condition, element_locator: str, find_by, explicit_wait_multiplier):
+        """
+        Waits for the element condition with the configured backend and records the time spent.
+
+        :param condition: Condition name understood by the observer script.
+        :param expected_condition: Matching expected_conditions factory used by the polling backend.
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
+        :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
+        """
+        timeout = self.explicit_timeout * explicit_wait_multiplier
+        locator_method, locator_value = self._resolve_locator(element_locator, find_by)
+        started = time.perf_counter()
+        try:
+            if self.wait_backend == "observer":
+                self._ensure_script_timeout(timeout)
+                strategy = "xpath" if locator_method == By.XPATH else "css"
+                deadline = started + timeout
+                while True:
+                    remaining = deadline - time.perf_counter()
+                    try:
+                        satisfied = remaining > 0 and self.driver.execute_async_script(
+                            _OBSERVER_WAIT_SCRIPT, locator_value, strategy, condition, int(remaining * 1000))
+                        break
+                    except JavascriptException as e:
+                        # A navigation unloaded the watcher with the page; re-arm it on the new document
+                        if not is_document_unloaded(e):
+                            raise
+                    except TimeoutException:
+                        # Selenium raises the W3C 'script timeout' error as TimeoutException
+                        satisfied = False
+                        break
+                if not satisfied:
+                    raise TimeoutException(f"Element {locator_value} not {condition} after {timeout}s")
+            else:
+                WebDriverWait(self.driver, timeout).until(expected_condition((locator_method, locator_value)))
+        finally:
+            self.wait_timings.append({
+                'backend': self.wait_backend,
+                'condition': condition,
+                'locator': locator_value,
+                'seconds': time.perf_counter() - started,
+            })
+
     def explicitly_wait_till_presence_of_element_located(self, element_locator: str, find_by="xpath", explicit_wait_multiplier=1):
         """
         Waits until the element is present in the DOM.
 
-        :param element_locator: Locator for the element (XPath or CSS).
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         """
-        locator_method = By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR
-        WebDriverWait(self.driver, self.explicit_timeout * explicit_wait_multiplier).until(
-            EC.presence_of_element_located((locator_method, element_locator))
-        )
+        self._wait_for("presence", EC.presence_of_element_located, element_locator, find_by, explicit_wait_multiplier)
 
     def explicitly_wait_till_visibility_of_element_located(self, element_locator: str, find_by="xpath", explicit_wait_multiplier=1):
         """
         Waits until the element is visible on the page.
 
-        :param element_locator: Locator for the element (XPath or CSS).
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         """
-        locator_method = By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR
-        WebDriverWait(self.driver, self.explicit_timeout * explicit_wait_multiplier).until(
-            EC.visibility_of_element_located((locator_method, element_locator))
-        )
+        self._wait_for("visibility", EC.visibility_of_element_located, element_locator, find_by, explicit_wait_multiplier)
 
     def explicitly_wait_till_invisibility_of_element_located(self, element_locator: str, find_by="xpath", explicit_wait_multiplier=1):
         """
         Waits until the element is no longer visible.
 
-        :param element_locator: Locator for the element (XPath or CSS).
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         """
-        locator_method = By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR
-        WebDriverWait(self.driver, self.explicit_timeout * explicit_wait_multiplier).until(
-            EC.invisibility_of_element_located((locator_method, element_locator))
-        )
+        self._wait_for("invisibility", EC.invisibility_of_element_located, element_locator, find_by, explicit_wait_multiplier)
 
     def explicitly_wait_till_element_is_clickable(self, element_locator: str, find_by="xpath", explicit_wait_multiplier=1):
         """
         Waits until the element is clickable.
 
-        :param element_locator: Locator for the element (XPath or CSS).
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         """
-        locator_method = By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR
-        WebDriverWait(self.driver, self.explicit_timeout * explicit_wait_multiplier).until(
-            EC.element_to_be_clickable((locator_method, element_locator))
-        )
+        self._wait_for("clickable", EC.element_to_be_clickable, element_locator, find_by, explicit_wait_multiplier)
 
     def scroll_to_element(self, element_locator: str, find_by="xpath", explicit_wait_multiplier=1):
         """
         Scrolls the page until the specified element is in view.
 
-        :param element_locator: Locator for the element (XPath or CSS).
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         """
-        self.explicitly_wait_till_presence_of_element_located(element_locator, find_by, explicit_wait_multiplier)
-        element = self.driver.find_element(by=By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR, value=element_locator)
-        self.driver.execute_script("arguments[0].scrollIntoView();", element)
+        self.flush_actions()
+        self._run_on_element(element_locator, find_by, explicit_wait_multiplier,
+                             self.explicitly_wait_till_presence_of_element_located,
+                             lambda element: self.driver.execute_script("arguments[0].scrollIntoView();", element))
 
     def click_element(self, element_locator: str, find_by="xpath", explicit_wait_multiplier=1):
         """
         Clicks the element after waiting for it to be clickable.
 
-        :param element_locator: Locator for the element (XPath or CSS).
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         """
-        self.explicitly_wait_till_element_is_clickable(element_locator, find_by, explicit_wait_multiplier)
-        element = self.driver.find_element(by=By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR, value=element_locator)
-        element.click()
+        self.flush_actions()
+        self._run_on_element(element_locator, find_by, explicit_wait_multiplier,
+                             self.explicitly_wait_till_element_is_clickable,
+                             lambda element: element.click())
 
     def input_text_in_field(self, element_locator: str, text: str, find_by="xpath", clear=False, explicit_wait_multiplier=1):
         """
         Enters text into an input field.
 
-        :param element_locator: Locator for the input field (XPath or CSS).
+        :param element_locator: Locator object, or locator string for the input field (XPath or CSS).
         :param text: Text to enter into the field.
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param clear: If True, clears the field before entering the text.
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         """
-        self.explicitly_wait_till_presence_of_element_located(element_locator, find_by, explicit_wait_multiplier)
-        element = self.driver.find_element(by=By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR, value=element_locator)
-        if clear:
-            element.clear()
-        element.send_keys(text)
+        def fill(element):
+            if clear:
+                element.clear()
+            element.send_keys(text)
+
+        self.flush_actions()
+        self._run_on_element(element_locator, find_by, explicit_wait_multiplier,
+                             self.explicitly_wait_till_presence_of_element_located, fill)
 
     def get_text(self, element_locator: str, find_by="xpath", explicit_wait_multiplier=1) -> str:
         """
         Retrieves the text of the element.
 
-        :param element_locator: Locator for the element (XPath or CSS).
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         :return: Text content of the element.
         """
-        self.explicitly_wait_till_visibility_of_element_located(element_locator, find_by, explicit_wait_multiplier)
-        element = self.driver.find_element(by=By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR, value=element_locator)
-        return element.text
+        self.flush_actions()
+        return self._run_on_element(element_locator, find_by, explicit_wait_multiplier,
+                                    self.explicitly_wait_till_visibility_of_element_located,
+                                    lambda element: element.text)
 
     def move_slider(self, element_locator: str, x_value=1, y_value=1, find_by="xpath", explicit_wait_multiplier=1):
         """
         Moves the slider element by a given offset.
 
-        :param element_locator: Locator for the slider element (XPath or CSS).
+        :param element_locator: Locator object, or locator string for the slider element (XPath or CSS).
         :param x_value: Horizontal movement of the slider.
         :param y_value: Vertical movement of the slider.
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         """
-        self.explicitly_wait_till_visibility_of_element_located(element_locator, find_by, explicit_wait_multiplier)
-        element = self.driver.find_element(by=By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR, value=element_locator)
-        action = ActionChains(self.driver)
-        action.drag_and_drop_by_offset(element, x_value, y_value).perform()
+        self._run_on_element(element_locator, find_by, explicit_wait_multiplier,
+                             self.explicitly_wait_till_visibility_of_element_located,
+                             lambda element: self._queue_actions(
+                                 lambda actions: actions.drag_and_drop_by_offset(element, x_value, y_value)))
 
     def get_attribute_value_of_element(self, element_locator: str, attribute_name, find_by="xpath", explicit_wait_multiplier=1):
         """
         Retrieves the value of an attribute of an element.
 
-        :param element_locator: Locator for the element (XPath or CSS).
+        :param element_locator: Locator object, or locator string for the element (XPath or CSS).
         :param attribute_name: Name of the attribute to retrieve.
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         :return: Value of the specified attribute.
         """
-        self.explicitly_wait_till_visibility_of_element_located(element_locator, find_by, explicit_wait_multiplier)
-        element = self.driver.find_element(by=By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR, value=element_locator)
-        return element.get_attribute(attribute_name)
+        self.flush_actions()
+        return self._run_on_element(element_locator, find_by, explicit_wait_multiplier,
+                                    self.explicitly_wait_till_visibility_of_element_located,
+                                    lambda element: element.get_attribute(attribute_name))
 
     def fill_text_using_action_chain(self, element_locator: str, text: str, find_by="xpath", explicit_wait_multiplier=1, clear=False):
         """
         Fills text in an input field using ActionChains (ideal for complex interactions).
 
-        :param element_locator: Locator for the input field (XPath or CSS).
+        :param element_locator: Locator object, or locator string for the input field (XPath or CSS).
         :param text: Text to enter into the field.
-        :param find_by: Method to locate the element ('xpath' or 'css').
+        :param find_by: Method to locate string locators ('xpath' or 'css').
         :param explicit_wait_multiplier: Multiplier for explicit wait timeout.
         :param clear: If True, clears the field before entering the text.
         """
-        self.explicitly_wait_till_presence_of_element_located(element_locator, find_by, explicit_wait_multiplier)
-        element = self.driver.find_element(by=By.XPATH if find_by.lower() == "xpath" else By.CSS_SELECTOR, value=element_locator)
-        actions = ActionChains(self.driver)
-        if clear:
-            element.clear()
-        actions.send_keys_to_element(element, text).perform()
+        def fill(element):
+            if clear:
+                self.flush_actions()
+                element.clear()
+            self._queue_actions(lambda actions: actions.send_keys_to_element(element, text))
+
+        self._run_on_element(element_locator, find_by, explicit_wait_multiplier,
+                             self.explicitly_wait_till_presence_of_element_located, fill)
 
     def press_keyboard_key(self, key):
         """
@@ -193,5 +526,27 @@ class DriverUtilitiesMethod:
 
         :param key: Key to press.
         """
-        actions = ActionChains(self.driver)
-        actions.send_keys(key).perform()
+        self._queue_actions(lambda actions: actions.send_keys(key))
+
+    def query_elements(self, queries: dict, find_by="xpath") -> dict:
+        """
+        Reads values from several elements in a single execute_script round trip.
+
+        Each query maps a result name to a tuple of (locator, read) or (locator, 'attribute', attribute_name),
+        where read is one of 'text', 'attribute', 'checked' or 'rect'. Elements that are not found yield None.
+
+        :param queries: Dictionary of result name to query tuple.
+        :param find_by: Method to locate string locators ('xpath' or 'css').
+        :return: Dictionary of result name to the value read from the page.
+        """
+        batch = []
+        for name, query in queries.items():
+            read = query[1]
+            if read not in ("text", "attribute", "checked", "rect"):
+                raise ValueError(f"Unsupported read '{read}' for query '{name}'")
+            locator_method, locator_value = self._resolve_locator(query[0], find_by)
+            strategy = "xpath" if locator_method == By.XPATH else "css"
+            attribute_name = query[2] if read == "attribute" else None
+            batch.append([name, locator_value, strategy, read, attribute_name])
+        self.flush_actions()
+        return self.driver.execute_script(_BULK_QUERY_SCRIPT, batch)
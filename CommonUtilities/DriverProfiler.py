@@ -0,0 +1,167 @@
+import functools
+import json
+import time
+from contextlib import contextmanager
+
+
+class DriverProfiler:
+    """
+    This class records per-call latency for page objects and per-command latency for the underlying
+    WebDriver. Nothing is wrapped until attach/attach_driver is called, so an unused profiler adds no
+    overhead to a run.
+
+    Every record carries the call stack at the time it ran (e.g. RevenuePageFunction.select_cpt_checkbox ->
+    DriverUtilitiesMethod.click_element -> webdriver:findElement), which is used to split time spent waiting
+    from time spent on other commands and to attribute it to the calling page-function method.
+    """
+
+    # Frames whose commands count as waiting time
+    wait_prefixes = ('explicitly_wait_till_', '_wait_for')
+
+    def __init__(self):
+        """
+        Initializes an empty profile.
+        """
+        self.records = []
+        self.collapsed = {}
+        self._stack = []
+
+    def _enter(self, label, kind):
+        """
+        Pushes a frame and returns it.
+        """
+        frame = {'label': label, 'kind': kind, 'child_time': 0.0, 'start': time.perf_counter()}
+        self._stack.append(frame)
+        return frame
+
+    def _exit(self, frame):
+        """
+        Pops a frame and records its wall time, self time and wait/command classification.
+        """
+        wall = time.perf_counter() - frame['start']
+        labels = [entry['label'] for entry in self._stack]
+        self._stack.pop()
+        if self._stack:
+            self._stack[-1]['child_time'] += wall
+
+        stack_key = ';'.join(labels)
+        self.collapsed[stack_key] = self.collapsed.get(stack_key, 0.0) + wall - frame['child_time']
+
+        page_function = next(
+            (label for label in reversed(labels[:-1]) if not label.startswith(('DriverUtilitiesMethod.', 'webdriver:'))),
+            None
+        )
+        self.records.append({
+            'name': frame['label'],
+            'kind': frame['kind'],
+            'stack': labels,
+            'page_function': page_function,
+            'in_wait': any(label.split('.')[-1].startswith(self.wait_prefixes) for label in labels),
+            'wall': wall,
+        })
+
+    @contextmanager
+    def measure(self, label):
+        """
+        Records the wall time of an arbitrary block, such as DriverBase.initiate_driver.
+
+        :param label: Name of the block in the profile.
+        """
+        frame = self._enter(label, 'block')
+        try:
+            yield
+        finally:
+            self._exit(frame)
+
+    def _wrap(self, label, kind, func):
+        """
+        Returns func wrapped so that each call is recorded under label.
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            frame = self._enter(label, kind)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit(frame)
+        return wrapper
+
+    def attach(self, page_object):
+        """
+        Wraps every public method and helper of a DriverUtilitiesMethod (or page object) instance.
+
+        The wrappers are installed on the instance, so other instances of the same class are not affected.
+
+        :param page_object: A DriverUtilitiesMethod, HomePageFunctions or RevenuePageFunction instance.
+        :return: The same instance, for chaining.
+        """
+        for cls in reversed(type(page_object).__mro__):
+            for name, member in vars(cls).items():
+                if name.startswith('__') or not callable(member) or isinstance(member, (staticmethod, type)):
+                    continue
+                if name.startswith('_') and not name.startswith(self.wait_prefixes):
+                    continue
+                setattr(page_object, name, self._wrap(f'{cls.__name__}.{name}', 'call', getattr(page_object, name)))
+        return page_object
+
+    def attach_driver(self, driver):
+        """
+        Wraps WebDriver.execute on the driver instance so that every protocol command is recorded.
+
+        :param driver: WebDriver instance.
+        :return: The same driver, for chaining.
+        """
+        execute = driver.execute
+
+        def profiled_execute(driver_command, params=None):
+            frame = self._enter(f'webdriver:{driver_command}', 'command')
+            try:
+                return execute(driver_command, params)
+            finally:
+                self._exit(frame)
+
+        driver.execute = profiled_execute
+        return driver
+
+    @staticmethod
+    def detach_driver(driver):
+        """
+        Removes the wrapper installed by attach_driver, e.g. before a pooled session is reused.
+
+        :param driver: WebDriver instance.
+        """
+        vars(driver).pop('execute', None)
+
+    def summary(self):
+        """
+        Returns the totals of the run.
+
+        :return: Dictionary with total wall time, wait and non-wait command time, and command count.
+        """
+        commands = [record for record in self.records if record['kind'] == 'command']
+        top_level = [record for record in self.records if len(record['stack']) == 1]
+        return {
+            'wall_time': sum(record['wall'] for record in top_level),
+            'wait_time': sum(record['wall'] for record in commands if record['in_wait']),
+            'command_time': sum(record['wall'] for record in commands if not record['in_wait']),
+            'command_count': len(commands),
+        }
+
+    def export_json(self, path):
+        """
+        Writes the summary and every record to a JSON file.
+
+        :param path: Output file path.
+        """
+        with open(path, 'w') as output:
+            json.dump({'summary': self.summary(), 'records': self.records}, output, indent=2)
+
+    def export_collapsed(self, path):
+        """
+        Writes self time per stack in the collapsed-stack format read by flamegraph tools, in microseconds.
+
+        :param path: Output file path.
+        """
+        with open(path, 'w') as output:
+            for stack_key, seconds in sorted(self.collapsed.items()):
+                output.write(f'{stack_key} {int(seconds * 1_000_000)}\n')
@@ -0,0 +1,171 @@
+import queue
+from contextlib import contextmanager
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, WebDriverException
+from CommonUtilities.DriverBaseUtilities import DriverBase
+
+# Messages of generic WebDriverExceptions raised when the browser or its driver is gone
+_SESSION_LOST_MESSAGES = ('disconnected', 'session deleted', 'not reachable', 'no such session',
+                          'target window already closed', 'browser has closed', 'session not created')
+
+
+def is_session_fatal(error):
+    """
+    Tells whether an exception means the WebDriver session is unusable and has to be relaunched.
+
+    Timeouts, missing or stale elements and intercepted clicks are not fatal: the session is
+    still alive and the flow can continue on it.
+
+    Args:
+        error (Exception): The exception raised by a WebDriver call.
+
+    Returns:
+        bool: True if the session is lost.
+    """
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+        return True
+    if type(error).__name__ in ('MaxRetryError', 'NewConnectionError', 'ProtocolError'):
+        return True
+    if type(error) is WebDriverException:
+        message = (error.msg or '').lower()
+        return any(text in message for text in _SESSION_LOST_MESSAGES)
+    return False
+
+
+class DriverSessionPool:
+    """
+    This class keeps a number of pre-launched WebDriver sessions warm so that retries and consecutive
+    runs do not pay for browser startup. Sessions are health-checked and reset on checkout instead of
+    being quit and relaunched.
+    """
+
+    # Clears storage for the current origin; pages such as about:blank refuse storage access
+    _reset_storage_script = """
+    try { window.localStorage.clear(); } catch (error) {}
+    try { window.sessionStorage.clear(); } catch (error) {}
+    """
+
+    def __init__(self, browser, size=1, option=None, preset=None, arguments=()):
+        """
+        Launches the initial sessions.
+
+        Args:
+            browser (str): The browser name passed to DriverBase (chrome, firefox, or edge).
+            size (int): Number of sessions to keep warm.
+            option: Options passed to DriverBase.initiate_driver for every session.
+            preset (str): Browser profile preset passed to DriverBase.launch instead of option.
+            arguments (iterable): Extra browser arguments passed to DriverBase.launch with the preset.
+        """
+        self.driver_base = DriverBase(browser)
+        self.option = option
+        self.preset = preset
+        self.arguments = tuple(arguments)
+        self.size = size
+        self.idle = queue.LifoQueue()
+        self.launched = 0
+        for _ in range(size):
+            self.idle.put(self._launch())
+
+    def _launch(self):
+        """
+        Starts a new session.
+        """
+        self.launched += 1
+        if self.preset:
+            return self.driver_base.launch(self.preset, self.arguments)
+        return self.driver_base.initiate_driver(self.option)
+
+    @staticmethod
+    def is_healthy(driver):
+        """
+        Checks that a session still answers commands.
+
+        Args:
+            driver: WebDriver instance.
+
+        Returns:
+            bool: True if the session responded.
+        """
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def reset(self, driver):
+        """
+        Returns a session to a clean state: cookies and storage cleared, extra windows closed, on about:blank.
+
+        Args:
+            driver: WebDriver instance.
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.delete_all_cookies()
+        driver.execute_script(self._reset_storage_script)
+        driver.get('about:blank')
+
+    @staticmethod
+    def _quit(driver):
+        """
+        Quits a session, ignoring errors from sessions that are already gone.
+        """
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def checkout(self):
+        """
+        Takes a healthy, reset session from the pool, launching a replacement if the idle one is broken.
+
+        Returns:
+            webdriver instance: A ready-to-use WebDriver session.
+        """
+        try:
+            driver = self.idle.get_nowait()
+        except queue.Empty:
+            return self._launch()
+        try:
+            if self.is_healthy(driver):
+                self.reset(driver)
+                return driver
+        except Exception:
+            pass
+        self._quit(driver)
+        return self._launch()
+
+    def checkin(self, driver):
+        """
+        Returns a session to the pool, or quits it if the pool is already full.
+
+        Args:
+            driver: WebDriver instance obtained from checkout.
+        """
+        if self.idle.qsize() < self.size:
+            self.idle.put(driver)
+        else:
+            self._quit(driver)
+
+    @contextmanager
+    def session(self):
+        """
+        Checks out a session for the duration of a with-block and checks it back in afterwards.
+        """
+        driver = self.checkout()
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def close(self):
+        """
+        Quits every idle session.
+        """
+        while True:
+            try:
+                self._quit(self.idle.get_nowait())
+            except queue.Empty:
+                break
@@ -0,0 +1,297 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# Response headers replayed as recorded; bodies are stored decoded, so encoding and length are not
+_REPLAYED_HEADERS = ('content-type', 'cache-control', 'location')
+
+# Content types whose bodies may contain absolute URLs that have to point at the replay server
+_TEXT_TYPES = re.compile(r'text/|javascript|json|xml|css|svg', re.IGNORECASE)
+
+# Path prefix under which the replay server serves origins other than the snapshot's main origin
+_ORIGIN_PREFIX = '/__origin__/'
+
+
+def _origin(url):
+    """
+    Returns the scheme://host[:port] part of a URL.
+    """
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'
+
+
+class SiteSnapshot:
+    """
+    This class keeps an on-disk, content-addressed archive of HTTP responses. Bodies are stored once per
+    SHA-256 digest under blobs/, and index.json maps every recorded URL to its status, headers and digest.
+    """
+
+    def __init__(self, path):
+        """
+        Opens (or starts) the archive in a directory.
+
+        Args:
+            path (str): The archive directory.
+        """
+        self.path = path
+        try:
+            with open(os.path.join(path, 'index.json')) as index:
+                self.index = json.load(index)
+        except (OSError, ValueError):
+            self.index = {'origin': None, 'recorded': None, 'entries': {}}
+        self._by_path = None
+
+    @property
+    def origin(self):
+        return self.index['origin']
+
+    @property
+    def entries(self):
+        return self.index['entries']
+
+    def _blob_path(self, digest):
+        return os.path.join(self.path, 'blobs', digest[:2], digest)
+
+    def _put_blob(self, body):
+        """
+        Stores a body under its digest, unless an identical body is already stored.
+
+        Returns:
+            str: The SHA-256 digest of the body.
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            temporary_path = f'{blob_path}.tmp'
+            with open(temporary_path, 'wb') as blob:
+                blob.write(body)
+            os.replace(temporary_path, blob_path)
+        return digest
+
+    def start(self, url):
+        """
+        Starts a new snapshot of the site at url, replacing the recorded entries on save.
+        """
+        self.index = {'origin': _origin(url), 'recorded': None, 'entries': {}}
+        self._by_path = None
+
+    def add(self, url, status, headers, body=b''):
+        """
+        Records one response.
+
+        Args:
+            url (str): The absolute request URL.
+            status (int): The HTTP status.
+            headers (dict): Response headers; only _REPLAYED_HEADERS are kept.
+            body (bytes): The decoded response body.
+        """
+        headers = {name.lower(): value for name, value in headers.items()}
+        self.entries[url] = {
+            'status': status,
+            'headers': {name: headers[name] for name in _REPLAYED_HEADERS if name in headers},
+            'body': self._put_blob(body),
+        }
+        self._by_path = None
+
+    def save(self):
+        """
+        Writes the index atomically and removes blobs no entry refers to any more.
+        """
+        self.index['recorded'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        os.makedirs(self.path, exist_ok=True)
+        index_path = os.path.join(self.path, 'index.json')
+        with open(f'{index_path}.tmp', 'w') as index:
+            json.dump(self.index, index, indent=2)
+        os.replace(f'{index_path}.tmp', index_path)
+
+        referenced = {entry['body'] for entry in self.entries.values()}
+        blob_dir = os.path.join(self.path, 'blobs')
+        for directory, _, names in os.walk(blob_dir):
+            for name in names:
+                if name not in referenced:
+                    os.remove(os.path.join(directory, name))
+
+    def lookup(self, url):
+        """
+        Returns the recorded response for a URL. A URL recorded only with a different query string
+        (e.g. a cache buster) falls back to the first recording of the same path.
+
+        Returns:
+            tuple: (status, headers, body bytes), or None if the URL was not recorded.
+        """
+        entry = self.entries.get(url)
+        if entry is None:
+            if self._by_path is None:
+                self._by_path = {}
+                for recorded_url in self.entries:
+                    self._by_path.setdefault(recorded_url.split('?', 1)[0], recorded_url)
+            recorded_url = self._by_path.get(url.split('?', 1)[0])
+            if recorded_url is None:
+                return None
+            entry = self.entries[recorded_url]
+        with open(self._blob_path(entry['body']), 'rb') as blob:
+            return entry['status'], entry['headers'], blob.read()
+
+
+def record_snapshot(driver, snapshot, url, explore):
+    """
+    Records every GET response the browser receives while exploring the site into the snapshot.
+
+    The driver must be a Chrome or Edge session launched with performance logging
+    ('goog:loggingPrefs': {'performance': 'ALL'}); bodies are read through the DevTools protocol
+    before the session ends, so the exploration must not leave the page with a full navigation.
+
+    Args:
+        driver: WebDriver instance with performance logging enabled.
+        snapshot (SiteSnapshot): The archive to record into; it is restarted for url and saved.
+        url (str): The entry URL, whose origin becomes the snapshot's main origin.
+        explore (callable): Called with the driver to visit the pages to record.
+
+    Returns:
+        int: Number of recorded responses.
+    """
+    # Keep response bodies in the browser's buffers until they are read below
+    driver.execute_cdp_cmd('Network.enable', {'maxTotalBufferSize': 200 * 2 ** 20, 'maxResourceBufferSize': 50 * 2 ** 20})
+    driver.get_log('performance')  # Drop events from before the recording
+    explore(driver)
+
+    snapshot.start(url)
+    methods, responses = {}, {}
+    for log_entry in driver.get_log('performance'):
+        message = json.loads(log_entry['message'])['message']
+        params = message.get('params', {})
+        if message['method'] == 'Network.requestWillBeSent':
+            methods[params['requestId']] = params['request']['method']
+            # A redirect ends one hop of the request; record it so replay follows the same chain
+            redirect = params.get('redirectResponse')
+            if redirect and params['request']['method'] == 'GET':
+                snapshot.add(redirect['url'], redirect['status'], redirect['headers'])
+        elif message['method'] == 'Network.responseReceived':
+            responses[params['requestId']] = params['response']
+        elif message['method'] == 'Network.loadingFinished' and params['requestId'] in responses:
+            response = responses.pop(params['requestId'])
+            if methods.get(params['requestId']) != 'GET' or not response['url'].startswith('http'):
+                continue
+            try:
+                content = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+            except Exception:
+                # Evicted or bodiless responses are left out; replay answers them with 404
+                continue
+            body = content['body']
+            body = base64.b64decode(body) if content['base64Encoded'] else body.encode('utf-8')
+            snapshot.add(response['url'], response['status'], response['headers'], body)
+
+    snapshot.save()
+    return len(snapshot.entries)
+
+
+class ReplayServer:
+    """
+    This class serves a SiteSnapshot from a local HTTP server. The snapshot's main origin is served at the
+    server root and any other recorded origin under /__origin__/<scheme>/<host>/; absolute URLs in text
+    bodies and redirects are rewritten accordingly, so the whole session stays on the local server.
+    Unrecorded URLs get a 404, which keeps replayed runs offline and deterministic.
+    """
+
+    def __init__(self, snapshot, host='127.0.0.1', port=0):
+        """
+        Args:
+            snapshot (SiteSnapshot): The archive to serve.
+            host (str): Interface to listen on.
+            port (int): Port to listen on; 0 picks a free one.
+        """
+        self.snapshot = snapshot
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.base_url = f'http://{host}:{self.server.server_address[1]}'
+
+        # Recorded origins other than the main one, longest first so no origin is a prefix of a later one
+        origins = {_origin(url) for url in snapshot.entries} - {snapshot.origin}
+        self.rewrites = [(snapshot.origin, self.base_url)] + [
+            (origin, self.local_url(origin)) for origin in sorted(origins, key=len, reverse=True)
+        ]
+
+    def local_url(self, url):
+        """
+        Maps an absolute URL of the recorded site to its URL on the replay server.
+        """
+        if not url.startswith('http'):
+            return url  # Relative URLs already resolve against the replay server
+        if url.startswith(self.snapshot.origin):
+            return self.base_url + url[len(self.snapshot.origin):]
+        parts = urlsplit(url)
+        return f'{self.base_url}{_ORIGIN_PREFIX}{parts.scheme}/{parts.netloc}{url[len(_origin(url)):]}'
+
+    def recorded_url(self, path):
+        """
+        Maps a request path on the replay server back to the recorded URL.
+        """
+        if path.startswith(_ORIGIN_PREFIX):
+            scheme, netloc, rest = (path[len(_ORIGIN_PREFIX):].split('/', 2) + ['', ''])[:3]
+            return f'{scheme}://{netloc}/{rest}'
+        return self.snapshot.origin + path
+
+    def rewrite(self, text):
+        """
+        Points the absolute URLs of recorded origins in a text body at the replay server,
+        including the JSON-escaped form (https:\\/\\/host) used by inline scripts.
+        """
+        for origin, local in self.rewrites:
+            text = text.replace(origin, local)
+            text = text.replace(origin.replace('/', '\\/'), local.replace('/', '\\/'))
+        return text
+
+    def _handler(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                recorded = replay.snapshot.lookup(replay.recorded_url(self.path))
+                if recorded is None:
+                    self.send_error(404, 'Not in snapshot')
+                    return
+                status, headers, body = recorded
+                if _TEXT_TYPES.search(headers.get('content-type', '')):
+                    body = replay.rewrite(body.decode('utf-8', 'replace')).encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, replay.local_url(value) if name == 'location' else value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def chrome_arguments(self):
+        """
+        Chromium arguments that make every host except the replay server unresolvable,
+        so a resource missing from the snapshot fails instead of going to the internet.
+        """
+        return [f'--host-resolver-rules=MAP * ~NOTFOUND , EXCLUDE {urlsplit(self.base_url).hostname}']
+
+    def start(self):
+        """
+        Serves in a background thread.
+
+        Returns:
+            ReplayServer: self, for chaining.
+        """
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """
+        Stops serving and releases the port.
+        """
+        self.server.shutdown()
+        self.server.server_close()
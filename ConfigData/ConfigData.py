@@ -14,3 +14,10 @@ class ConfigData:
         self.cpt_list_to_select = ['99091', '99453', '99454', '99474']  # List of CPT codes to select
         self.slider_value_to_move = 820  # The target value to move the slider to
         self.slider_value_to_fill = '560'  # The value to input into the slider field (as a string)
+        self.expected_total = '$110700'  # The expected total recurring amount for the values above, None computes it
+        # Reimbursement rate per patient per month of each CPT code (e.g. {'99091': 48, ...}), used by
+        # App.RevenueModel when expected_total is None; there is no default, the rates must be configured
+        self.cpt_reimbursement_rates = None
+        self.profile_output = None  # File prefix for the run profile (<prefix>.json and <prefix>.folded), None disables it
+        self.browser_profile = None  # Browser profile preset (default, headless, eager or lean), None launches without options
+        self.replay_archive = None  # Snapshot directory to replay the site from (see Runner/SnapshotRunner.py), None uses the live site
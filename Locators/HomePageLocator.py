@@ -1 +1,3 @@
-revenue_calculator_btn = '//div[text()="Revenue Calculator"]'
+from Locators.LocatorRegistry import xpath
+
+revenue_calculator_btn = xpath('//div[text()="Revenue Calculator"]')
@@ -0,0 +1,205 @@
+import re
+from selenium.webdriver.common.by import By
+
+
+class Locator:
+    """
+    An immutable element locator with its lookup strategy resolved once at definition time.
+
+    Attributes:
+        by (str): The Selenium strategy (By.XPATH or By.CSS_SELECTOR).
+        value (str): The locator expression.
+        strategy (str): The short strategy name used by in-page scripts ('xpath' or 'css').
+    """
+
+    __slots__ = ('by', 'value', 'strategy')
+
+    def __init__(self, by, value):
+        object.__setattr__(self, 'by', by)
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'strategy', 'xpath' if by == By.XPATH else 'css')
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Locator objects are immutable')
+
+    # Rebuild through __init__ so pickling (e.g. to pool workers) does not go through __setattr__
+    def __reduce__(self):
+        return Locator, (self.by, self.value)
+
+    # Immutable, so copies can be the object itself
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __eq__(self, other):
+        return isinstance(other, Locator) and (self.by, self.value) == (other.by, other.value)
+
+    def __hash__(self):
+        return hash((self.by, self.value))
+
+    def __repr__(self):
+        return f'Locator({self.by!r}, {self.value!r})'
+
+    def __str__(self):
+        return self.value
+
+
+class LocatorTemplate:
+    """
+    A parameterized locator whose rendered Locator objects are memoized per argument set.
+
+    Attributes:
+        by (str): The Selenium strategy used for every rendered locator.
+        template (str): The str.format template of the locator expression.
+    """
+
+    __slots__ = ('by', 'template', '_rendered')
+
+    def __init__(self, by, template):
+        object.__setattr__(self, 'by', by)
+        object.__setattr__(self, 'template', template)
+        object.__setattr__(self, '_rendered', {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError('LocatorTemplate objects are immutable')
+
+    # Pickles without the memo of rendered locators, which is rebuilt on demand
+    def __reduce__(self):
+        return LocatorTemplate, (self.by, self.template)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def format(self, **kwargs):
+        """
+        Renders the template, reusing the Locator built for the same arguments earlier.
+
+        Args:
+            **kwargs: The template fields (e.g. cpt_to_select='99091').
+
+        Returns:
+            Locator: The rendered locator.
+        """
+        key = tuple(sorted(kwargs.items()))
+        locator = self._rendered.get(key)
+        if locator is None:
+            locator = Locator(self.by, self.template.format(**kwargs))
+            self._rendered[key] = locator
+        return locator
+
+    def __repr__(self):
+        return f'LocatorTemplate({self.by!r}, {self.template!r})'
+
+
+def xpath(value):
+    """
+    Defines an XPath locator.
+    """
+    return Locator(By.XPATH, value)
+
+
+def css(value):
+    """
+    Defines a CSS selector locator.
+    """
+    return Locator(By.CSS_SELECTOR, value)
+
+
+def xpath_template(template):
+    """
+    Defines a parameterized XPath locator.
+    """
+    return LocatorTemplate(By.XPATH, template)
+
+
+# //tag[@attr="value"] and //tag[contains(@attr, "value")] with either quote style
+_ATTRIBUTE_EQUALS = re.compile(r'''^//([\w*-]+)\[@([\w-]+)\s*=\s*(["'])([^"']*)\3\]$''')
+_ATTRIBUTE_CONTAINS = re.compile(r'''^//([\w*-]+)\[contains\(\s*@([\w-]+)\s*,\s*(["'])([^"']*)\3\s*\)\]$''')
+
+
+def rewrite_to_css(locator):
+    """
+    Rewrites simple XPath locators (attribute equality and attribute contains) into CSS selectors.
+
+    Locators that cannot be expressed in CSS, such as text() matches or parent axes, are returned unchanged.
+
+    Args:
+        locator (Locator): The locator to rewrite.
+
+    Returns:
+        Locator: The equivalent CSS locator, or the original locator.
+    """
+    if not isinstance(locator, Locator) or locator.by != By.XPATH:
+        return locator
+    match = _ATTRIBUTE_EQUALS.match(locator.value)
+    operator = '='
+    if not match:
+        match = _ATTRIBUTE_CONTAINS.match(locator.value)
+        operator = '*='
+    if not match:
+        return locator
+    tag, attribute, _, value = match.groups()
+    return css(f'{tag}[{attribute}{operator}"{value}"]')
+
+
+def rewrite_module_to_css(module):
+    """
+    Replaces every rewritable Locator defined in a locator module with its CSS equivalent, in place.
+
+    Args:
+        module: A locator module such as Locators.RevenuePageLocator.
+
+    Returns:
+        dict: The names of the rewritten locators mapped to their new Locator.
+    """
+    rewritten = {}
+    for name, locator in list(vars(module).items()):
+        if isinstance(locator, Locator):
+            css_locator = rewrite_to_css(locator)
+            if css_locator is not locator:
+                setattr(module, name, css_locator)
+                rewritten[name] = css_locator
+    return rewritten
+
+
+def module_locators(module):
+    """
+    Returns every Locator defined in a locator module, keyed by its attribute name.
+    """
+    return {name: locator for name, locator in vars(module).items() if isinstance(locator, Locator)}
+
+
+# Counts the matches of every [name, locator, strategy] entry in arguments[0] in one round trip
+_VALIDATE_SCRIPT = """
+var counts = {};
+arguments[0].forEach(function (entry) {
+    try {
+        counts[entry[0]] = entry[2] === 'xpath'
+            ? document.evaluate(entry[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength
+            : document.querySelectorAll(entry[1]).length;
+    } catch (error) {
+        counts[entry[0]] = -1;
+    }
+});
+return counts;
+"""
+
+
+def validate_locators(driver, locators):
+    """
+    Checks a set of locators against the current page in a single execute_script call.
+
+    Args:
+        driver: The WebDriver instance showing the page to check.
+        locators (dict): Names mapped to Locator objects (see module_locators).
+
+    Returns:
+        dict: Names mapped to the number of matching elements; -1 marks an invalid expression.
+    """
+    batch = [[name, locator.value, locator.strategy] for name, locator in locators.items()]
+    return driver.execute_script(_VALIDATE_SCRIPT, batch)
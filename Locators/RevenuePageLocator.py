@@ -1,6 +1,8 @@
-slider_btn_input = '//input[@type="range"]'
-slider_btn = "//span[contains(@class,'MuiSlider-thumb')]"
-slider_value_input = '//input[contains(@class, "MuiInputBase")]'
-cpt_box_dynamic = '//p[contains(text(), "CPT-{cpt_to_select}")]'
-cpt_check_box_dynamic = '//p[contains(text(), "{cpt_to_select}")]/parent::div//input/parent::span'
-total_recurring_amount = '//p[text()="Total Recurring Reimbursement for all Patients Per Month:"]/p'
+from Locators.LocatorRegistry import xpath, xpath_template
+
+slider_btn_input = xpath('//input[@type="range"]')
+slider_btn = xpath("//span[contains(@class,'MuiSlider-thumb')]")
+slider_value_input = xpath('//input[contains(@class, "MuiInputBase")]')
+cpt_box_dynamic = xpath_template('//p[contains(text(), "CPT-{cpt_to_select}")]')
+cpt_check_box_dynamic = xpath_template('//p[contains(text(), "{cpt_to_select}")]/parent::div//input/parent::span')
+total_recurring_amount = xpath('//p[text()="Total Recurring Reimbursement for all Patients Per Month:"]/p')
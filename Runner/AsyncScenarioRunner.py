@@ -0,0 +1,122 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CommonUtilities.AsyncDriverFunctionUtilities import AsyncWebDriverClient, run_concurrently  # noqa: E402
+from App.AsyncHomePageFunctions import AsyncHomePageFunctions  # noqa: E402
+from App.AsyncRevenuePageFunctions import AsyncRevenuePageFunction  # noqa: E402
+from App.AutomationFlow import expected_total_for  # noqa: E402
+from Runner.ScenarioRunner import scenario_config  # noqa: E402
+
+# Headless Chrome capabilities used for every session
+CHROME_CAPABILITIES = {
+    'browserName': 'chrome',
+    'goog:chromeOptions': {'args': ['--headless=new', '--window-size=1920,1080']},
+}
+
+
+async def run_flow_async(client, cd, capabilities=None):
+    """
+    Runs the revenue calculator flow in a new session of the shared client.
+
+    Args:
+        client (AsyncWebDriverClient): Client holding the keep-alive connection pool.
+        cd (ConfigData): The configuration of the scenario.
+        capabilities (dict): W3C capabilities for the session. Defaults to headless Chrome.
+
+    Returns:
+        bool: True if the final page state matched the configuration.
+    """
+    session = await client.new_session(capabilities or CHROME_CAPABILITIES)
+    try:
+        homepage = AsyncHomePageFunctions(session, cd.explicit_timeout)
+        revenue_page = AsyncRevenuePageFunction(session, cd.explicit_timeout)
+
+        await homepage.navigate_to_url(cd.web_url)
+        await homepage.click_revenue_calculator_btn()
+        await revenue_page.move_and_check_slider_by_value(value=cd.slider_value_to_move)
+        await revenue_page.fill_and_check_value_in_slider_input(value=cd.slider_value_to_fill)
+        await revenue_page.select_cpts(cd.cpt_list_to_select)
+        return await revenue_page.check_revenue_page_state(
+            slider_value=cd.slider_value_to_fill,
+            cpt_list=cd.cpt_list_to_select,
+            expected_total=expected_total_for(cd)
+        )
+    finally:
+        await session.quit()
+
+
+async def run_scenario_async(client, scenario, capabilities=None):
+    """
+    Builds the scenario's configuration and runs its flow. Building it inside the coroutine makes an
+    invalid scenario fail on its own instead of aborting the whole run.
+    """
+    return await run_flow_async(client, scenario_config(scenario), capabilities)
+
+
+async def run_scenarios_async(scenarios, endpoint, sessions=20, capabilities=None):
+    """
+    Runs scenarios as concurrent sessions against one WebDriver endpoint from a single event loop.
+
+    Args:
+        scenarios (list): Scenario dictionaries (see ScenarioRunner.SCENARIO_FIELDS).
+        endpoint (str): WebDriver endpoint, e.g. http://127.0.0.1:9515 for a running chromedriver.
+        sessions (int): Maximum number of concurrent sessions.
+        capabilities (dict): W3C capabilities for every session. Defaults to headless Chrome.
+
+    Returns:
+        list: Per-scenario results (index, passed, error, seconds), in scenario order.
+    """
+    client = AsyncWebDriverClient(endpoint, connection_limit=sessions)
+    try:
+        outcomes = await run_concurrently(
+            [run_scenario_async(client, scenario, capabilities) for scenario in scenarios], sessions
+        )
+    finally:
+        await client.close()
+
+    results = []
+    for index, (outcome, seconds) in enumerate(outcomes):
+        failed = isinstance(outcome, Exception)
+        results.append({'index': index, 'scenario': scenarios[index], 'passed': not failed and bool(outcome),
+                        'error': f"{type(outcome).__name__}: {outcome}" if failed else None, 'seconds': seconds})
+    return results
+
+
+def main_async_runner():
+    """
+    Runs a JSON list of scenarios as concurrent sessions against a running WebDriver endpoint.
+    """
+    parser = argparse.ArgumentParser(description='Run revenue calculator scenarios concurrently from one event loop')
+    parser.add_argument('scenarios', help='JSON file containing a list of scenario objects')
+    parser.add_argument('--endpoint', default='http://127.0.0.1:9515', help='WebDriver endpoint (e.g. chromedriver)')
+    parser.add_argument('--sessions', type=int, default=20, help='Concurrent sessions')
+    parser.add_argument('--output', default=None, help='Write the results to this JSON file')
+    args = parser.parse_args()
+
+    with open(args.scenarios) as source:
+        scenarios = json.load(source)
+
+    started = time.perf_counter()
+    results = asyncio.run(run_scenarios_async(scenarios, args.endpoint, args.sessions))
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        status = 'PASS' if result['passed'] else 'FAIL'
+        print(f"[{status}] scenario {result['index']} in {result['seconds']:.2f}s"
+              + (f" ({result['error']})" if result['error'] else ''))
+    passed = sum(result['passed'] for result in results)
+    print(f"{passed}/{len(results)} passed in {elapsed:.2f}s ({len(results) / elapsed:.2f} scenarios/s)")
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == '__main__':
+    main_async_runner()
@@ -0,0 +1,224 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.common.exceptions import TimeoutException  # noqa: E402
+from CommonUtilities.DriverBaseUtilities import DriverBase  # noqa: E402
+from App.AutomationFlow import automation_flow_steps, run_automation_flow  # noqa: E402
+from Runner.ScenarioRunner import scenario_config  # noqa: E402
+
+try:
+    import psutil
+except ImportError:  # Memory figures are reported as None without psutil
+    psutil = None
+
+# Keep timers and rendering of background tabs running at full speed
+BACKGROUND_TAB_ARGUMENTS = ('--disable-background-timer-throttling', '--disable-renderer-backgrounding',
+                            '--disable-backgrounding-occluded-windows')
+
+
+def browser_memory(driver):
+    """
+    Returns the resident memory in bytes of the driver's browser process tree, or None without psutil.
+    """
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        return sum(process.memory_info().rss for process in [root] + root.children(recursive=True))
+    except (psutil.Error, AttributeError):
+        return None
+
+
+def launch_browser(browser, page_load_strategy='normal'):
+    """
+    Launches a headless browser with background tab throttling disabled.
+
+    Args:
+        browser (str): Browser name passed to DriverBase.
+        page_load_strategy (str): 'normal' blocks navigation commands until the page has loaded; 'none'
+                                  returns at once, leaving the readiness probes to gate the next batch.
+    """
+    db = DriverBase(browser)
+    options = db.headless_options()
+    options.page_load_strategy = page_load_strategy
+    if browser.lower() != 'firefox':
+        for argument in BACKGROUND_TAB_ARGUMENTS:
+            options.add_argument(argument)
+    return db.initiate_driver(options)
+
+
+class _Tab:
+    """
+    A window handle running one scenario flow.
+    """
+
+    def __init__(self, handle, index, scenario, driver):
+        self.handle = handle
+        self.index = index
+        self.scenario = scenario
+        self.cd = scenario_config(scenario)
+        # The element cache is per driver; another tab's elements would only cost a stale lookup here
+        self.steps = automation_flow_steps(driver, self.cd, use_element_cache=False)
+        self.probe = None
+        self.probe_started = None
+        self.started = time.perf_counter()
+
+
+def run_scenarios_in_tabs(scenarios, tabs=4, browser='Chrome'):
+    """
+    Runs scenarios in up to `tabs` window handles of a single browser.
+
+    Each tab runs the flow from automation_flow_steps. The browser is launched with the 'none' page load
+    strategy, so navigating a tab returns at once and page loads overlap too. The scheduler visits the tabs round-robin:
+    a tab whose readiness probe has not passed yet is skipped, so one tab's waiting overlaps the
+    other tabs' command batches. A probe that stays false beyond the scenario's explicit timeout fails it.
+
+    Args:
+        scenarios (list): Scenario dictionaries (see ScenarioRunner.SCENARIO_FIELDS).
+        tabs (int): Number of concurrent tabs.
+        browser (str): Browser name passed to DriverBase.
+
+    Returns:
+        dict: 'results' (per-scenario index, passed, error, seconds), 'seconds', 'throughput'
+              and 'memory_per_scenario' (peak browser memory divided by the tabs in flight).
+    """
+    driver = launch_browser(browser, page_load_strategy='none')
+    pending = list(enumerate(scenarios))
+    active = []
+    results = []
+    peak_memory = None
+    started = time.perf_counter()
+
+    # Windows that are open but not running a scenario; the browser starts with one
+    spare_handles = [driver.current_window_handle]
+
+    def open_tab():
+        index, scenario = pending.pop(0)
+        if spare_handles:
+            driver.switch_to.window(spare_handles.pop())
+        else:
+            driver.switch_to.window(driver.window_handles[0])
+            driver.switch_to.new_window('tab')
+        active.append(_Tab(driver.current_window_handle, index, scenario, driver))
+
+    def finish(tab, passed, error=None):
+        results.append({'index': tab.index, 'scenario': tab.scenario, 'passed': bool(passed), 'error': error,
+                        'seconds': time.perf_counter() - tab.started})
+        active.remove(tab)
+        # Close the finished tab, keeping the last window open (blank) so the session survives
+        if len(driver.window_handles) > 1:
+            driver.close()
+        else:
+            driver.get('about:blank')
+            spare_handles.append(tab.handle)
+
+    try:
+        while pending or active:
+            while pending and len(active) < tabs:
+                open_tab()
+            memory = browser_memory(driver)
+            if memory is not None:
+                peak_memory = max(peak_memory or 0, memory / len(active))
+
+            for tab in list(active):
+                driver.switch_to.window(tab.handle)
+                try:
+                    # Skip the tab until its probe passes, failing it once the explicit timeout is spent
+                    if tab.probe is not None and not tab.probe():
+                        if time.perf_counter() - tab.probe_started > tab.cd.explicit_timeout:
+                            tab.steps.throw(TimeoutException('Readiness probe did not pass'))
+                        continue
+                    tab.probe = next(tab.steps)
+                    tab.probe_started = time.perf_counter()
+                except StopIteration as finished:
+                    finish(tab, finished.value)
+                except Exception as e:
+                    finish(tab, False, f"{type(e).__name__}: {e}")
+    finally:
+        driver.quit()
+
+    elapsed = time.perf_counter() - started
+    return {
+        'results': sorted(results, key=lambda result: result['index']),
+        'seconds': elapsed,
+        'throughput': len(results) / elapsed if elapsed else 0.0,
+        'memory_per_scenario': peak_memory,
+    }
+
+
+def run_scenarios_one_browser_each(scenarios, browser='Chrome'):
+    """
+    Baseline for comparison: runs each scenario in its own freshly launched browser, one after another.
+
+    Returns:
+        dict: The same keys as run_scenarios_in_tabs; memory_per_scenario is the peak single-browser memory.
+    """
+    results = []
+    peak_memory = None
+    started = time.perf_counter()
+    for index, scenario in enumerate(scenarios):
+        scenario_started = time.perf_counter()
+        driver = launch_browser(browser)
+        result = {'index': index, 'scenario': scenario, 'passed': False, 'error': None}
+        try:
+            result['passed'] = bool(run_automation_flow(driver, scenario_config(scenario)))
+            memory = browser_memory(driver)
+            if memory is not None:
+                peak_memory = max(peak_memory or 0, memory)
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+        finally:
+            driver.quit()
+        result['seconds'] = time.perf_counter() - scenario_started
+        results.append(result)
+
+    elapsed = time.perf_counter() - started
+    return {
+        'results': results,
+        'seconds': elapsed,
+        'throughput': len(results) / elapsed if elapsed else 0.0,
+        'memory_per_scenario': peak_memory,
+    }
+
+
+def _describe(label, report):
+    memory = report['memory_per_scenario']
+    passed = sum(result['passed'] for result in report['results'])
+    print(f"{label}: {passed}/{len(report['results'])} passed in {report['seconds']:.2f}s, "
+          f"{report['throughput']:.2f} scenarios/s, "
+          f"memory per scenario {f'{memory / 2 ** 20:.0f} MB' if memory is not None else 'n/a'}")
+
+
+def main_multi_tab():
+    """
+    Runs a JSON list of scenarios in tabs of one browser and optionally compares with one browser per scenario.
+    """
+    parser = argparse.ArgumentParser(description='Run revenue calculator scenarios in tabs of a single browser')
+    parser.add_argument('scenarios', help='JSON file containing a list of scenario objects')
+    parser.add_argument('--tabs', type=int, default=4, help='Concurrent tabs')
+    parser.add_argument('--browser', default='Chrome', help='Browser to launch')
+    parser.add_argument('--compare', action='store_true', help='Also run one browser per scenario for comparison')
+    parser.add_argument('--output', default=None, help='Write the reports to this JSON file')
+    args = parser.parse_args()
+
+    with open(args.scenarios) as source:
+        scenarios = json.load(source)
+
+    reports = {'multi_tab': run_scenarios_in_tabs(scenarios, tabs=args.tabs, browser=args.browser)}
+    _describe(f'{args.tabs} tabs, one browser', reports['multi_tab'])
+    if args.compare:
+        reports['browser_per_scenario'] = run_scenarios_one_browser_each(scenarios, browser=args.browser)
+        _describe('One browser per scenario', reports['browser_per_scenario'])
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(reports, output, indent=2)
+
+
+if __name__ == '__main__':
+    main_multi_tab()
@@ -0,0 +1,93 @@
+import json
+import os
+import sqlite3
+
+# Sinks are written from one thread only (run_matrix's submitting thread): a sqlite3 connection may
+# only be used on the thread that created it
+
+
+class JsonlResultSink:
+    """
+    This class appends scenario results, including their per-step reports, to a JSON Lines file
+    in batches.
+    """
+
+    def __init__(self, path, batch_size=500):
+        self.output = open(path, 'a')
+        self.batch_size = batch_size
+        self.buffer = []
+
+    def write(self, result):
+        self.buffer.append(json.dumps(result))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.output.write('\n'.join(self.buffer) + '\n')
+            self.output.flush()
+            self.buffer = []
+
+    def close(self):
+        self.flush()
+        self.output.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SqliteResultSink:
+    """
+    This class stores scenario results in a SQLite database, one row per scenario in `scenarios` and
+    one row per step in `steps`, committing once per batch.
+    """
+
+    def __init__(self, path, batch_size=500):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+        CREATE TABLE IF NOT EXISTS scenarios (row INTEGER PRIMARY KEY, scenario TEXT, passed INTEGER,
+                                              error TEXT, seconds REAL, worker INTEGER);
+        CREATE TABLE IF NOT EXISTS steps (row INTEGER, step TEXT, status TEXT, attempts INTEGER,
+                                          seconds REAL, error TEXT, PRIMARY KEY (row, step));
+        """)
+        self.batch_size = batch_size
+        self.scenario_rows = []
+        self.step_rows = []
+
+    def write(self, result):
+        self.scenario_rows.append((result['index'], json.dumps(result['scenario']), int(result['passed']),
+                                   result['error'], result['seconds'], result['worker']))
+        for step, entry in result.get('steps', {}).items():
+            self.step_rows.append((result['index'], step, entry['status'], entry['attempts'],
+                                   entry['seconds'], entry['error']))
+        if len(self.scenario_rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        with self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO scenarios VALUES (?, ?, ?, ?, ?, ?)', self.scenario_rows)
+            self.connection.executemany('INSERT OR REPLACE INTO steps VALUES (?, ?, ?, ?, ?, ?)', self.step_rows)
+        self.scenario_rows = []
+        self.step_rows = []
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_sink(path, batch_size=500):
+    """
+    Opens a SQLite sink for .db/.sqlite/.sqlite3 paths and a JSONL sink otherwise.
+    """
+    if os.path.splitext(path)[1].lower() in ('.db', '.sqlite', '.sqlite3'):
+        return SqliteResultSink(path, batch_size)
+    return JsonlResultSink(path, batch_size)
@@ -0,0 +1,257 @@
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Runner.ScenarioRunner import _init_worker, _run_scenario_steps, revenue_cross_check_scenarios  # noqa: E402
+from Runner.ResultSinks import JsonlResultSink, SqliteResultSink, open_sink  # noqa: E402,F401
+from ConfigData.ConfigData import ConfigData  # noqa: E402
+
+# CSV columns holding numbers; cpt_list_to_select holds codes separated by ';'
+_INTEGER_FIELDS = ('slider_value_to_move', 'explicit_timeout')
+
+
+def read_csv_scenarios(path):
+    """
+    Lazily reads scenarios from a CSV file whose header names scenario fields.
+
+    Empty cells are left out, except an empty expected_total, which becomes None so the total is
+    computed from the revenue model. cpt_list_to_select holds the codes separated by ';' and
+    cpt_reimbursement_rates a JSON object.
+
+    Args:
+        path (str): The CSV file.
+
+    Yields:
+        dict: One scenario per row.
+    """
+    with open(path, newline='') as source:
+        for row in csv.DictReader(source):
+            scenario = {}
+            for field, value in row.items():
+                if value in (None, ''):
+                    if field == 'expected_total':
+                        scenario[field] = None
+                    continue
+                if field == 'cpt_list_to_select':
+                    value = [code.strip() for code in value.split(';') if code.strip()]
+                elif field in _INTEGER_FIELDS:
+                    value = int(value)
+                elif field == 'cpt_reimbursement_rates':
+                    value = json.loads(value)
+                scenario[field] = value
+            yield scenario
+
+
+def read_jsonl_scenarios(path):
+    """
+    Lazily reads scenarios from a JSON Lines file, one scenario object per line.
+
+    Args:
+        path (str): The JSONL file.
+
+    Yields:
+        dict: One scenario per non-empty line.
+    """
+    with open(path) as source:
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+
+
+def product_scenarios(slider_values, cpt_sets, table):
+    """
+    Generates the Cartesian product of slider values and CPT sets. The slider is moved to and filled
+    with the same value, and the expected total is looked up in the revenue table precomputed for the
+    grid, so the workers do not recompute it. Only the inputs and the table are held in memory
+    (itertools.product keeps a copy of each input), never the product itself.
+
+    Args:
+        slider_values (list): Patient counts.
+        cpt_sets (list): Lists of CPT codes.
+        table (RevenueTable): Expected totals for the grid (see App.RevenueModel).
+
+    Yields:
+        dict: One scenario per combination.
+    """
+    from App.RevenueModel import format_total
+    for value, codes in itertools.product(slider_values, cpt_sets):
+        yield {
+            'slider_value_to_move': value,
+            'slider_value_to_fill': str(value),
+            'cpt_list_to_select': list(codes),
+            'expected_total': format_total(table.lookup(value, codes)),
+        }
+
+
+def with_rates(scenarios, rates):
+    """
+    Gives the reimbursement rates to every scenario that has none, so their expected totals can be
+    computed from the revenue model.
+
+    Args:
+        scenarios (iterable): The scenario matrix.
+        rates (dict): CPT reimbursement rates.
+
+    Yields:
+        dict: The scenarios, with cpt_reimbursement_rates filled in where it was missing.
+    """
+    for scenario in scenarios:
+        if scenario.get('cpt_reimbursement_rates') is None:
+            scenario = dict(scenario, cpt_reimbursement_rates=rates)
+        yield scenario
+
+
+def parse_shard(text):
+    """
+    Parses a 'i/n' shard specification, 1 <= i <= n.
+
+    Returns:
+        tuple: (i, n)
+    """
+    try:
+        index, count = (int(part) for part in text.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{text}', expected i/n") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{text}', expected 1 <= i <= n")
+    return index, count
+
+
+def shard(scenarios, index=1, count=1):
+    """
+    Selects every count-th scenario of the matrix, starting at the index-th, keeping the matrix row
+    numbers. Every node reading the same matrix with a different index gets a disjoint, deterministic part.
+
+    Args:
+        scenarios (iterable): The scenario matrix.
+        index (int): This node's shard, 1 <= index <= count.
+        count (int): Number of shards.
+
+    Yields:
+        tuple: (matrix row number, scenario)
+    """
+    for row, scenario in enumerate(scenarios):
+        if row % count == index - 1:
+            yield row, scenario
+
+
+def run_matrix(rows, sink, workers=None, browser='Chrome', in_flight=None):
+    """
+    Runs a stream of (row, scenario) pairs across worker processes and writes each result to the sink.
+
+    Only `in_flight` scenarios are submitted at a time and results are not kept, so memory stays
+    constant however long the matrix is. (Pool.imap would read the whole input ahead of the workers.)
+
+    Args:
+        rows (iterable): (matrix row number, scenario) pairs, e.g. from shard().
+        sink: JsonlResultSink or SqliteResultSink (see Runner.ResultSinks), written only from this thread.
+        workers (int): Number of worker processes. Defaults to the CPU count.
+        browser (str): Browser name passed to DriverBase.
+        in_flight (int): Scenarios submitted ahead of the results. Defaults to twice the workers.
+
+    Returns:
+        tuple: (scenarios run, scenarios passed)
+    """
+    workers = workers or os.cpu_count() or 1
+    in_flight = in_flight or 2 * workers
+    # The pool's callbacks only enqueue; results are written to the sink here, on the thread that opened it
+    results = queue.Queue()
+    counts = [0, 0]
+
+    def record(outcome):
+        if isinstance(outcome, BaseException):
+            raise outcome
+        sink.write(outcome)
+        counts[0] += 1
+        counts[1] += bool(outcome['passed'])
+
+    with multiprocessing.Pool(processes=workers, initializer=_init_worker, initargs=(browser,)) as pool:
+        pending = 0
+        for row in rows:
+            if pending >= in_flight:
+                record(results.get())
+                pending -= 1
+            pool.apply_async(_run_scenario_steps, (row,), callback=results.put, error_callback=results.put)
+            pending += 1
+        while pending:
+            record(results.get())
+            pending -= 1
+        # Let the workers exit on their own so their browsers quit; leaving the block terminates them
+        pool.close()
+        pool.join()
+    return tuple(counts)
+
+
+def main_matrix():
+    """
+    Runs a scenario matrix (file or generated product), or one shard of it, into a result sink.
+    """
+    parser = argparse.ArgumentParser(description='Run a streamed scenario matrix into a JSONL or SQLite result sink')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--csv', help='CSV file with one scenario per row (header: scenario fields)')
+    source.add_argument('--jsonl', help='JSON Lines file with one scenario object per line')
+    source.add_argument('--sliders', nargs='+', help='Slider values for a generated product; START:STOP:STEP ranges allowed')
+    parser.add_argument('--cpt-sets', nargs='+', default=None,
+                        help="CPT sets for the generated product, codes separated by ',' (e.g. 99091,99453)")
+    parser.add_argument('--sample', type=int, default=None,
+                        help='Run only this many combinations of the generated product in the browser, '
+                             'sampled from its revenue table to cross-check the local revenue model')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed of the --sample selection; shards must use the same seed to split one sample')
+    parser.add_argument('--rates', default=None,
+                        help='JSON file mapping CPT codes to reimbursement rates, required for a generated product '
+                             'and used by file rows without rates')
+    parser.add_argument('--shard', default='1/1', help='Run only shard i of n, e.g. 2/4')
+    parser.add_argument('--sink', required=True, help='Result file: .db/.sqlite for SQLite, anything else for JSONL')
+    parser.add_argument('--batch-size', type=int, default=500, help='Results per sink write')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--browser', default='Chrome', help='Browser to launch in each worker')
+    args = parser.parse_args()
+
+    rates = None
+    if args.rates:
+        with open(args.rates) as source:
+            rates = json.load(source)
+
+    if args.csv:
+        scenarios = read_csv_scenarios(args.csv)
+    elif args.jsonl:
+        scenarios = read_jsonl_scenarios(args.jsonl)
+    else:
+        slider_values = list(itertools.chain.from_iterable(
+            range(*(int(part) for part in value.split(':'))) if ':' in value else [int(value)]
+            for value in args.sliders
+        ))
+        # Without CPT sets, every slider value runs with the configured codes
+        cpt_sets = [codes.split(',') for codes in args.cpt_sets] if args.cpt_sets else [ConfigData().cpt_list_to_select]
+        if rates is None:
+            parser.error('--rates is required with --sliders: expected totals are computed from the rates')
+        from App.RevenueModel import RevenueModel
+        # Every expected total of the grid in one array operation; rows look theirs up
+        table = RevenueModel(rates).table(slider_values, cpt_sets)
+        if args.sample:
+            scenarios = revenue_cross_check_scenarios(table, args.sample, args.seed)
+        else:
+            scenarios = product_scenarios(slider_values, cpt_sets, table)
+    if rates is not None and (args.csv or args.jsonl):
+        scenarios = with_rates(scenarios, rates)
+
+    index, count = parse_shard(args.shard)
+    started = time.perf_counter()
+    with open_sink(args.sink, args.batch_size) as sink:
+        total, passed = run_matrix(shard(scenarios, index, count), sink, workers=args.workers, browser=args.browser)
+    elapsed = time.perf_counter() - started
+    print(f"Shard {index}/{count}: {passed}/{total} passed in {elapsed:.2f}s "
+          f"({total / elapsed if elapsed else 0.0:.2f} scenarios/s), results in {args.sink}")
+
+
+if __name__ == '__main__':
+    main_matrix()
@@ -0,0 +1,250 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing.util import Finalize
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CommonUtilities.DriverBaseUtilities import DriverBase  # noqa: E402
+from App.AutomationFlow import run_automation_flow, CheckpointedFlow  # noqa: E402
+from ConfigData.ConfigData import ConfigData  # noqa: E402
+
+# Fields of ConfigData a scenario may override
+SCENARIO_FIELDS = ('web_url', 'explicit_timeout', 'cpt_list_to_select', 'slider_value_to_move',
+                   'slider_value_to_fill', 'expected_total', 'cpt_reimbursement_rates')
+
+# The headless browser owned by the current worker process, reused across scenarios
+_worker_driver = None
+_worker_browser = 'Chrome'
+
+
+def _coerce_field(field, value, default):
+    """
+    Converts a scenario value to the type of the field's ConfigData default, so values read as JSON
+    numbers or command-line strings (e.g. slider_value_to_fill=560) reach the flow with the types it
+    expects. A list field also accepts a ','-separated string; None and untyped (None) defaults pass through.
+    """
+    if value is None or default is None:
+        return value
+    try:
+        if isinstance(default, list):
+            if isinstance(value, str):
+                value = value.split(',')
+            return [str(item).strip() for item in value if str(item).strip()]
+        return type(default)(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid value {value!r} for scenario field '{field}'") from None
+
+
+def scenario_config(scenario):
+    """
+    Builds a ConfigData from the defaults overridden by the fields of a scenario.
+
+    Args:
+        scenario (dict): Any of the SCENARIO_FIELDS. Values are converted to the types of the defaults.
+
+    Returns:
+        ConfigData: The configuration for the scenario.
+    """
+    cd = ConfigData()
+    for field, value in scenario.items():
+        if field not in SCENARIO_FIELDS:
+            raise ValueError(f"Unknown scenario field '{field}'")
+        setattr(cd, field, _coerce_field(field, value, getattr(cd, field)))
+    return cd
+
+
+def revenue_cross_check_scenarios(table, count, seed=None):
+    """
+    Builds browser scenarios for a sample of a RevenueTable, to cross-check the local revenue model.
+
+    Args:
+        table (RevenueTable): The precomputed table (see App.RevenueModel).
+        count (int): Number of combinations to run in the browser.
+        seed (int): Seed for a reproducible sample.
+
+    Returns:
+        list: Scenario dictionaries for run_scenarios.
+    """
+    return [
+        {
+            'slider_value_to_move': patients,
+            'slider_value_to_fill': str(patients),
+            'cpt_list_to_select': codes,
+            'expected_total': expected_total,
+        }
+        for patients, codes, expected_total in table.sample(count, seed)
+    ]
+
+
+def _launch_worker_driver():
+    """
+    Starts the worker's headless browser and registers it to quit when the worker exits.
+
+    Raises:
+        RuntimeError: If the browser could not be launched. DriverBase.launch exits the process
+                      on failure, which in a pool worker would strand the task (and make the pool respawn
+                      workers endlessly from the initializer), so the exit is turned into an exception.
+    """
+    global _worker_driver
+    _worker_driver = None
+    db = DriverBase(_worker_browser)
+    try:
+        driver = db.launch('headless')
+    except SystemExit as e:
+        raise RuntimeError(f"Could not launch {_worker_browser} (exit code {e.code})") from None
+    _worker_driver = driver
+    Finalize(_worker_driver, _worker_driver.quit, exitpriority=10)
+
+
+def _relaunch_worker_driver():
+    """
+    Quits the worker's browser and launches a new one.
+
+    Returns:
+        str: The launch error, or None if the new browser is up.
+    """
+    if _worker_driver is not None:
+        try:
+            _worker_driver.quit()
+        except Exception:
+            pass
+    try:
+        _launch_worker_driver()
+    except RuntimeError as e:
+        # Leave the worker without a browser; the next scenario tries to launch it again
+        return str(e)
+    return None
+
+
+def _init_worker(browser):
+    """
+    Pool initializer: launches one browser per worker process. A failed launch is retried by the
+    worker's first scenario, which then reports the error as its result.
+    """
+    global _worker_browser
+    _worker_browser = browser
+    try:
+        _launch_worker_driver()
+    except RuntimeError as e:
+        print(f"Worker {os.getpid()}: {e}")
+
+
+def _session_alive():
+    """
+    Returns True if the worker's browser still answers commands.
+    """
+    try:
+        _worker_driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def _run_scenario(indexed_scenario):
+    """
+    Runs one scenario on the worker's browser and returns its result.
+    """
+    index, scenario = indexed_scenario
+    started = time.perf_counter()
+    result = {'index': index, 'scenario': scenario, 'worker': os.getpid(), 'passed': False, 'error': None}
+    if _worker_driver is None:
+        result['error'] = _relaunch_worker_driver()
+    if result['error'] is None:
+        try:
+            result['passed'] = bool(run_automation_flow(_worker_driver, scenario_config(scenario)))
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+            # Relaunch only if the failure took the browser down with it
+            if not _session_alive():
+                _relaunch_worker_driver()
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def _run_scenario_steps(indexed_scenario):
+    """
+    Runs one scenario on the worker's browser as checkpointed steps and returns its result with the
+    per-step report (status, attempts, seconds, error).
+    """
+    index, scenario = indexed_scenario
+    started = time.perf_counter()
+    result = {'index': index, 'scenario': scenario, 'worker': os.getpid(), 'passed': False, 'error': None}
+    if _worker_driver is None:
+        result['error'] = _relaunch_worker_driver()
+    if result['error'] is None:
+        try:
+            flow = CheckpointedFlow(scenario_config(scenario))
+            # Leave the previous scenario's page so the probe does not skip steps it finds in place
+            _worker_driver.get('about:blank')
+            flow.run(_worker_driver)
+            result['passed'] = bool(flow.passed)
+            result['steps'] = flow.report
+            failed = [entry['error'] for entry in flow.report.values() if entry['status'] == 'failed']
+            result['error'] = failed[0] if failed else None
+            lost = flow.session_lost
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+            lost = not _session_alive()
+        if lost:
+            _relaunch_worker_driver()
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def run_scenarios(scenarios, workers=None, browser='Chrome'):
+    """
+    Runs scenarios across a pool of worker processes, each reusing one headless browser.
+
+    Args:
+        scenarios (list): Scenario dictionaries (see SCENARIO_FIELDS).
+        workers (int): Number of worker processes. Defaults to the CPU count.
+        browser (str): Browser name passed to DriverBase.
+
+    Returns:
+        list: Per-scenario results (index, passed, error, seconds, worker pid), in scenario order.
+    """
+    workers = workers or os.cpu_count() or 1
+    with multiprocessing.Pool(processes=workers, initializer=_init_worker, initargs=(browser,)) as pool:
+        results = list(pool.imap_unordered(_run_scenario, enumerate(scenarios)))
+        # Let the workers exit on their own so their browsers quit; leaving the block terminates them
+        pool.close()
+        pool.join()
+    return sorted(results, key=lambda result: result['index'])
+
+
+def main_runner():
+    """
+    Runs a JSON list of scenarios from the command line and prints per-scenario and overall results.
+    """
+    parser = argparse.ArgumentParser(description='Run revenue calculator scenarios in parallel headless browsers')
+    parser.add_argument('scenarios', help='JSON file containing a list of scenario objects')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--browser', default='Chrome', help='Browser to launch in each worker')
+    parser.add_argument('--output', default=None, help='Write the results to this JSON file')
+    args = parser.parse_args()
+
+    with open(args.scenarios) as source:
+        scenarios = json.load(source)
+
+    started = time.perf_counter()
+    results = run_scenarios(scenarios, workers=args.workers, browser=args.browser)
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        status = 'PASS' if result['passed'] else 'FAIL'
+        print(f"[{status}] scenario {result['index']} in {result['seconds']:.2f}s"
+              + (f" ({result['error']})" if result['error'] else ''))
+    passed = sum(result['passed'] for result in results)
+    print(f"{passed}/{len(results)} passed in {elapsed:.2f}s ({len(results) / elapsed:.2f} scenarios/s)")
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == '__main__':
+    main_runner()
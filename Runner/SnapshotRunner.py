@@ -0,0 +1,79 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CommonUtilities.BrowserProfiles import build_options  # noqa: E402
+from CommonUtilities.DriverBaseUtilities import DriverBase  # noqa: E402
+from CommonUtilities.SiteSnapshot import SiteSnapshot, ReplayServer, record_snapshot  # noqa: E402
+from App.AutomationFlow import run_automation_flow  # noqa: E402
+from ConfigData.ConfigData import ConfigData  # noqa: E402
+
+DEFAULT_ARCHIVE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'snapshots', 'fitpeo')
+
+
+def record(archive, cd=None, browser='Chrome'):
+    """
+    Refreshes the snapshot: runs the flow once against the live site and records every response.
+
+    The flow clicks through the home page and the revenue calculator, so the scripts, styles and
+    data it triggers are captured as well. A failing flow still records what was loaded.
+
+    Args:
+        archive (str): The archive directory.
+        cd (ConfigData): Configuration to run the recording flow with. Defaults to a fresh ConfigData().
+        browser (str): chrome or edge; both expose the DevTools protocol needed for recording.
+
+    Returns:
+        int: Number of recorded responses.
+    """
+    cd = cd or ConfigData()
+    options = build_options(browser, 'headless')
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    driver = DriverBase(browser).initiate_driver(options)
+
+    def explore(explored_driver):
+        try:
+            run_automation_flow(explored_driver, cd)
+        except Exception as e:
+            print(f"Recording flow stopped early: {type(e).__name__}: {e}")
+
+    try:
+        return record_snapshot(driver, SiteSnapshot(archive), cd.web_url, explore)
+    finally:
+        driver.quit()
+
+
+def main_snapshot():
+    """
+    Records or serves the site snapshot from the command line.
+    """
+    parser = argparse.ArgumentParser(description='Record the site into a local snapshot or serve it for replay')
+    parser.add_argument('mode', choices=('record', 'serve'), help='record refreshes the snapshot, serve replays it')
+    parser.add_argument('--archive', default=DEFAULT_ARCHIVE, help='Snapshot directory')
+    parser.add_argument('--browser', default='Chrome', help='Browser used for recording (Chrome or Edge)')
+    parser.add_argument('--port', type=int, default=8765, help='Port of the replay server')
+    args = parser.parse_args()
+
+    if args.mode == 'record':
+        count = record(args.archive, browser=args.browser)
+        print(f"Recorded {count} responses into {args.archive}")
+        return
+
+    snapshot = SiteSnapshot(args.archive)
+    if not snapshot.origin:
+        print(f"No snapshot in {args.archive}, run with 'record' first")
+        sys.exit(1)
+    server = ReplayServer(snapshot, port=args.port).start()
+    print(f"Replaying {snapshot.origin} (recorded {snapshot.index['recorded']}) at {server.local_url(snapshot.origin)}/")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main_snapshot()
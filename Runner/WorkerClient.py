@@ -0,0 +1,89 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+
+# Only the standard library is imported here, so the client starts in milliseconds;
+# selenium and the page objects stay resident in the worker daemon (Runner/WorkerDaemon.py)
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), f'fitpeo-worker-{os.getuid()}.sock')
+
+
+def send_job(job, socket_path=DEFAULT_SOCKET):
+    """
+    Sends one job to the worker daemon and yields the events it streams back.
+
+    Args:
+        job (dict): {'scenario': {...}} with any of the scenario fields, or {'command': 'ping'|'shutdown'}.
+        socket_path (str): The daemon's Unix socket.
+
+    Yields:
+        dict: Events ('step', 'result', 'pong', 'error' or 'bye'), in the order the daemon sends them.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(json.dumps(job).encode('utf-8') + b'\n')
+        with connection.makefile('r', encoding='utf-8') as stream:
+            for line in stream:
+                yield json.loads(line)
+
+
+def _parse_field(text):
+    """
+    Parses a name=value override; the value is read as JSON when possible, else kept as a string.
+    """
+    name, _, value = text.partition('=')
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, value
+
+
+def main_client():
+    """
+    Submits a scenario (or a control command) to the worker daemon and prints the streamed results.
+    """
+    parser = argparse.ArgumentParser(description='Run a scenario on the warm worker daemon')
+    parser.add_argument('scenario', nargs='?', default=None, help="JSON file with a scenario object ('-' for stdin)")
+    parser.add_argument('--set', dest='fields', action='append', default=[], metavar='NAME=VALUE',
+                        help='Override a scenario field, e.g. --set slider_value_to_move=820')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help='Unix socket of the daemon')
+    parser.add_argument('--ping', action='store_true', help='Check that the daemon is up')
+    parser.add_argument('--shutdown', action='store_true', help='Stop the daemon')
+    args = parser.parse_args()
+
+    if args.ping or args.shutdown:
+        job = {'command': 'ping' if args.ping else 'shutdown'}
+    else:
+        scenario = {}
+        if args.scenario:
+            with (sys.stdin if args.scenario == '-' else open(args.scenario)) as source:
+                scenario = json.load(source)
+        scenario.update(_parse_field(field) for field in args.fields)
+        job = {'scenario': scenario}
+
+    # A scenario only passes on a result event; a connection closed without one is a failure
+    passed = 'command' in job
+    try:
+        for event in send_job(job, args.socket):
+            if event['event'] == 'step':
+                print(f"{event['step']}: {event['status']} ({event['seconds']:.2f}s)"
+                      + (f" - {event['error']}" if event['error'] else ''))
+            elif event['event'] == 'result':
+                passed = event['passed']
+                print(f"{'PASS' if passed else 'FAIL'} in {event['seconds']:.2f}s")
+            elif event['event'] == 'error':
+                passed = False
+                print(f"Error: {event['error']}")
+            else:
+                print(event['event'])
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No worker daemon listening on {args.socket}, start it with: python Runner/WorkerDaemon.py")
+        sys.exit(2)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == '__main__':
+    main_client()
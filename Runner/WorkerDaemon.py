@@ -0,0 +1,148 @@
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CommonUtilities.DriverSessionPool import DriverSessionPool  # noqa: E402
+from Runner.ScenarioRunner import scenario_config  # noqa: E402
+from Runner.WorkerClient import DEFAULT_SOCKET  # noqa: E402
+import main  # noqa: E402
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    """
+    Handles one connection: reads a JSON job line and streams JSON event lines back.
+    """
+
+    def send(self, event):
+        """
+        Writes one event line; a client that hung up does not stop the running job.
+        """
+        try:
+            self.wfile.write(json.dumps(event).encode('utf-8') + b'\n')
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def handle(self):
+        try:
+            job = json.loads(self.rfile.readline())
+        except ValueError as e:
+            self.send({'event': 'error', 'error': f"Invalid job: {e}"})
+            return
+
+        command = job.get('command')
+        if command == 'ping':
+            self.send({'event': 'pong', 'jobs': self.server.jobs, 'uptime': time.perf_counter() - self.server.started})
+            return
+        if command == 'shutdown':
+            self.send({'event': 'bye'})
+            # shutdown() waits for serve_forever, which runs this handler, so call it from another thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+
+        try:
+            cd = scenario_config(job.get('scenario', {}))
+        except ValueError as e:
+            self.send({'event': 'error', 'error': str(e)})
+            return
+
+        self.server.jobs += 1
+        started = time.perf_counter()
+        try:
+            report = main.resumable_automation(
+                self.server.session_pool, cd,
+                on_step=lambda name, entry: self.send({'event': 'step', 'step': name, **entry}),
+            )
+        except SystemExit as e:
+            # DriverBase exits when a replacement browser cannot be launched; report it and keep serving
+            self.send({'event': 'error', 'error': f"Could not launch the browser (exit code {e.code})"})
+            return
+        except Exception as e:
+            self.send({'event': 'error', 'error': f"{type(e).__name__}: {e}"})
+            return
+        self.send({'event': 'result', 'passed': report['validate']['status'] == 'done', 'report': report,
+                   'seconds': time.perf_counter() - started})
+
+
+class WorkerDaemon(socketserver.UnixStreamServer):
+    """
+    This class keeps the interpreter, the selenium and page imports and a warm browser session resident,
+    and runs scenario jobs received over a Unix socket one at a time on that session. Each job is a JSON
+    line {'scenario': {...}} with any of ScenarioRunner.SCENARIO_FIELDS; the per-step results are
+    streamed back as JSON lines while the flow runs, followed by the overall result.
+    """
+
+    def __init__(self, socket_path=DEFAULT_SOCKET, browser='Chrome', preset='headless'):
+        """
+        Launches the browser session and binds the socket.
+
+        Args:
+            socket_path (str): Path of the Unix socket to listen on.
+            browser (str): Browser name passed to DriverBase.
+            preset (str): Browser profile preset of the resident session.
+        """
+        self._remove_stale_socket(socket_path)
+        self.session_pool = DriverSessionPool(browser, size=1, preset=preset)
+        self.jobs = 0
+        self.started = time.perf_counter()
+        super().__init__(socket_path, _JobHandler)
+
+    @staticmethod
+    def _remove_stale_socket(socket_path):
+        """
+        Removes a socket file left behind by a daemon that died, refusing to replace a live one.
+        """
+        if not os.path.exists(socket_path):
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.remove(socket_path)
+                return
+        raise RuntimeError(f"A worker daemon is already listening on {socket_path}")
+
+    def server_close(self):
+        """
+        Closes the socket, removes its file and quits the browser.
+        """
+        super().server_close()
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+        self.session_pool.close()
+
+
+def main_daemon():
+    """
+    Starts the worker daemon from the command line and serves until shut down or terminated.
+    """
+    parser = argparse.ArgumentParser(description='Keep a browser warm and run scenario jobs received over a Unix socket')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help='Unix socket to listen on')
+    parser.add_argument('--browser', default='Chrome', help='Browser to keep resident')
+    parser.add_argument('--preset', default='headless', help='Browser profile preset of the resident session')
+    args = parser.parse_args()
+
+    # Let SIGTERM unwind through serve_forever so the browser is quit and the socket removed. It is raised
+    # as KeyboardInterrupt because the job handler turns SystemExit from a failed browser launch into an error
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    with WorkerDaemon(args.socket, args.browser, args.preset) as daemon:
+        print(f"Worker daemon listening on {args.socket}")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main_daemon()
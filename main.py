@@ -1,13 +1,13 @@
 import inspect
-import time
 from CommonUtilities.DriverBaseUtilities import DriverBase
-from CommonUtilities.DriverFunctionUtilities import DriverUtilitiesMethod
-from App.HomePageFunctions import HomePageFunctions
-from App.RevenuePageFunctions import RevenuePageFunction
+from CommonUtilities.DriverProfiler import DriverProfiler
+from CommonUtilities.DriverSessionPool import DriverSessionPool
+from CommonUtilities.SiteSnapshot import SiteSnapshot, ReplayServer
+from App.AutomationFlow import run_automation_flow, CheckpointedFlow
 from ConfigData.ConfigData import ConfigData
 
 
-def browser_automation():
+def browser_automation(cd=None, session_pool=None):
     """
     Initializes a browser session, navigates to the required webpage, interacts with the page elements,
     and performs automated actions to simulate user behavior on a web page.
@@ -18,72 +18,138 @@ def browser_automation():
     - Validates the slider's value and checks the total recurring amount.
     - Handles any exceptions that occur during the automation process and ensures the browser is closed at the end.
 
+    Args:
+        cd (ConfigData): Configuration to run with. Defaults to a fresh ConfigData().
+        session_pool (DriverSessionPool): Optional pool of warm sessions. When given, the session is checked
+                                          out from and returned to the pool instead of being launched and quit.
+
     Returns:
         bool: True if the automation was successful, False otherwise.
     """
-    # Initialize the driver
-    db = DriverBase('Chrome')  # Instantiate DriverBase with 'Chrome' browser
-    driver = db.initiate_driver()  # Initiate the driver
+    # Load configuration data (e.g., URL, slider value, timeout, etc.)
+    cd = cd or ConfigData()  # Load configuration data from the ConfigData module
+
+    # Profile the run only when an output is configured, so the default run has no wrappers installed
+    profiler = DriverProfiler() if cd.profile_output else None
+
+    # Initialize the driver, or take a warm one from the pool
+    if session_pool:
+        start_driver = session_pool.checkout
+        release_driver = session_pool.checkin
+        start_label = 'DriverSessionPool.checkout'
+    else:
+        db = DriverBase('Chrome')  # Instantiate DriverBase with 'Chrome' browser
+        if cd.browser_profile:
+            start_driver = lambda: db.launch(cd.browser_profile)
+            start_label = 'DriverBase.launch'
+        else:
+            start_driver = db.initiate_driver
+            start_label = 'DriverBase.initiate_driver'
+        release_driver = lambda driver: driver.quit()
+    if profiler:
+        with profiler.measure(start_label):
+            driver = start_driver()
+        profiler.attach_driver(driver)
+    else:
+        driver = start_driver()  # Initiate the driver
 
     try:
-        # Load configuration data (e.g., URL, slider value, timeout, etc.)
-        cd = ConfigData()  # Load configuration data from the ConfigData module
-
-        # Setup driver functions with the explicit timeout setting from the configuration
-        driver_function = DriverUtilitiesMethod(driver=driver, explicit_timeout=cd.explicit_timeout)
+        # Run the revenue calculator flow on the started driver
+        run_automation_flow(driver, cd, profiler)
 
-        # Set the browser window size
-        driver_function.set_browser_window_size(width='1920', height='1080')
+    except Exception as e:
+        # Catch any exceptions and log the type of error with the function where it occurred
+        print(f"Exception {type(e).__name__} occurs at: {inspect.stack()[1].function}")
 
-        # Navigate to the specified URL
-        driver_function.navigate_to_url(cd.web_url)
+        return False  # Return False to indicate failure
 
-        # Instantiate page-specific functions for homepage and revenue page
-        homepage = HomePageFunctions(driver=driver, explicit_timeout=cd.explicit_timeout)
-        revenue_page = RevenuePageFunction(driver=driver, explicit_timeout=cd.explicit_timeout)
+    finally:
+        # Close the browser (or return it to the pool), also when an exception occurs
+        if profiler:
+            profiler.detach_driver(driver)
+        release_driver(driver)
 
-        # Click on the revenue calculator button on the homepage
-        homepage.click_revenue_calculator_btn()
+        # Export the run profile, including failed runs
+        if profiler:
+            profiler.export_json(f'{cd.profile_output}.json')
+            profiler.export_collapsed(f'{cd.profile_output}.folded')
 
-        # Move the slider to a specific value and verify its value
-        revenue_page.move_and_check_slider_by_value(value=cd.slider_value_to_move)
+    return True  # Return True to indicate successful execution
 
-        # Fill the slider input field and verify the value
-        revenue_page.fill_and_check_value_in_slider_input(value=cd.slider_value_to_fill)
 
-        # Loop through the list of CPTs to select the checkboxes and apply them
-        for cpt in cd.cpt_list_to_select:
-            time.sleep(0.2)  # Adding a short delay between each action to mimic human behavior
-            revenue_page.select_cpt_checkbox(cpt=cpt)
+def resumable_automation(session_pool, cd=None, attempts=5, on_step=None):
+    """
+    Runs the flow as resumable steps, retrying failed steps on the same browser session.
 
-        # Check and validate the total recurring amount displayed on the page
-        revenue_page.check_total_recurring_amount()
+    Each retry probes the page for the furthest completed step and resumes after it. Only errors
+    that lose the session make the pool hand out a replacement (health-checked and relaunched).
 
-        # Close the browser once the automation is complete
-        driver.quit()
+    Args:
+        session_pool (DriverSessionPool): Pool providing the browser session.
+        cd (ConfigData): Configuration to run with. Defaults to a fresh ConfigData().
+        attempts (int): Maximum number of runs.
+        on_step (callable): Optional callback called with the step name and its report entry as steps finish.
 
-    except Exception as e:
-        # Catch any exceptions and log the type of error with the function where it occurred
-        print(f"Exception {type(e).__name__} occurs at: {inspect.stack()[1].function}")
-
-        # Ensure the driver quits even when an exception occurs
-        driver.quit()
-
-        return False  # Return False to indicate failure
+    Returns:
+        dict: Per-step status ('done', 'skipped', 'mismatch', 'failed' or 'pending'), attempts, time and error.
+    """
+    cd = cd or ConfigData()
+    profiler = DriverProfiler() if cd.profile_output else None
+    flow = CheckpointedFlow(cd, profiler, on_step)
 
-    return True  # Return True to indicate successful execution
+    driver = session_pool.checkout()
+    try:
+        for attempt in range(attempts):
+            if profiler:
+                profiler.attach_driver(driver)
+            completed = flow.run(driver)
+            if profiler:
+                profiler.detach_driver(driver)
+            if completed:
+                break
+            if flow.session_lost:
+                # Hand the dead session back; checkout health-checks it and launches a replacement
+                session_pool.checkin(driver)
+                driver = session_pool.checkout()
+    finally:
+        session_pool.checkin(driver)
+        if profiler:
+            profiler.export_json(f'{cd.profile_output}.json')
+            profiler.export_collapsed(f'{cd.profile_output}.folded')
+
+    return flow.report
 
 
 def main():
     """
     Main function to execute the browser automation with retries.
 
-    The browser automation function is retried up to 5 times in case of failure. If successful,
-    it stops further retries.
+    The flow is retried up to 5 times in case of failure. Retries resume from the furthest step already
+    in place on the page, and all attempts share one warm browser session unless it is lost. The outcome
+    of every step is printed at the end. With a replay archive configured the site is served locally.
     """
-    for i in range(5):  # Retry up to 5 times if it fails
-        if browser_automation():
-            break  # Exit the loop if the automation is successful
+    cd = ConfigData()
+
+    # Serve the site from the recorded snapshot instead of the internet when one is configured
+    replay_server = None
+    preset, arguments = cd.browser_profile, ()
+    if cd.replay_archive:
+        replay_server = ReplayServer(SiteSnapshot(cd.replay_archive)).start()
+        cd.web_url = replay_server.local_url(cd.web_url)
+        # Keep the browser from resolving any host but the replay server; the rules are launch arguments
+        preset, arguments = preset or 'default', replay_server.chrome_arguments()
+
+    session_pool = DriverSessionPool('Chrome', size=1, preset=preset, arguments=arguments)
+    try:
+        report = resumable_automation(session_pool, cd)
+    finally:
+        session_pool.close()
+        if replay_server:
+            replay_server.stop()
+
+    for name, entry in report.items():
+        print(f"{name}: {entry['status']} (attempts: {entry['attempts']}, {entry['seconds']:.2f}s)"
+              + (f" - {entry['error']}" if entry['error'] else ''))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('aiohttp')
+pytest.importorskip('selenium')
+
+from selenium.common import exceptions  # noqa: E402
+from CommonUtilities.AsyncDriverFunctionUtilities import AsyncWebDriverClient, ELEMENT_KEY  # noqa: E402
+from Runner.AsyncScenarioRunner import run_scenarios_async  # noqa: E402
+
+
+class StubWebDriver(BaseHTTPRequestHandler):
+    """
+    A minimal W3C endpoint: one session 'stub', a few commands, and W3C errors for everything else.
+    """
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like chromedriver
+    requests = []
+    connections = set()
+
+    def _reply(self, status, value):
+        body = json.dumps({'value': value}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = json.loads(self.rfile.read(length)) if length else None
+        StubWebDriver.requests.append((method, self.path, payload))
+        StubWebDriver.connections.add(self.client_address)
+        if method == 'POST' and self.path == '/session':
+            self._reply(200, {'sessionId': 'stub', 'capabilities': payload['capabilities']['alwaysMatch']})
+        elif not self.path.startswith('/session/stub'):
+            self._reply(404, {'error': 'invalid session id', 'message': 'No such session', 'stacktrace': ''})
+        elif method == 'POST' and self.path == '/session/stub/element':
+            if payload['value'] == '//missing':
+                self._reply(404, {'error': 'no such element', 'message': 'Not found', 'stacktrace': ''})
+            else:
+                self._reply(200, {ELEMENT_KEY: 'element-1'})
+        elif method == 'POST' and self.path == '/session/stub/execute/sync':
+            self._reply(200, payload['args'])
+        elif method == 'DELETE' and self.path == '/session/stub':
+            self._reply(200, None)
+        else:
+            self._reply(404, {'error': 'unknown command', 'message': self.path, 'stacktrace': ''})
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def endpoint():
+    StubWebDriver.requests = []
+    StubWebDriver.connections = set()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubWebDriver)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_commands_share_a_keep_alive_connection(endpoint):
+    async def scenario():
+        client = AsyncWebDriverClient(endpoint, connection_limit=1)
+        try:
+            session = await client.new_session({'browserName': 'chrome'})
+            element = await session.find_element('xpath', '//button')
+            echoed = await session.execute_script('return arguments;', 1, 'two')
+            await session.quit()
+            return session.session_id, element, echoed
+        finally:
+            await client.close()
+
+    session_id, element, echoed = asyncio.run(scenario())
+    assert session_id == 'stub'
+    assert element == 'element-1'
+    assert echoed == [1, 'two']
+    assert [(method, path) for method, path, _ in StubWebDriver.requests] == [
+        ('POST', '/session'), ('POST', '/session/stub/element'),
+        ('POST', '/session/stub/execute/sync'), ('DELETE', '/session/stub'),
+    ]
+    assert len(StubWebDriver.connections) == 1
+
+
+def test_w3c_errors_raise_the_matching_selenium_exceptions(endpoint):
+    async def scenario():
+        client = AsyncWebDriverClient(endpoint)
+        try:
+            session = await client.new_session({'browserName': 'chrome'})
+            with pytest.raises(exceptions.NoSuchElementException):
+                await session.find_element('xpath', '//missing')
+            with pytest.raises(exceptions.InvalidSessionIdException):
+                await client.request('GET', '/session/gone/url')
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_an_invalid_scenario_fails_alone(endpoint):
+    results = asyncio.run(run_scenarios_async([{'unknown_field': 1}], endpoint, sessions=2))
+    assert len(results) == 1
+    assert not results[0]['passed']
+    assert results[0]['error'].startswith('ValueError')
+    # The scenario was rejected before a session was requested for it
+    assert not any(path == '/session' for _, path, _ in StubWebDriver.requests)
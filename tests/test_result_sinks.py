@@ -0,0 +1,62 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from Runner.ResultSinks import open_sink
+
+BATCH_SIZE = 3
+RESULT_COUNT = 10
+
+
+def fake_result(indexed_scenario):
+    index, scenario = indexed_scenario
+    return {
+        'index': index, 'scenario': scenario, 'worker': os.getpid(), 'passed': index % 2 == 0, 'error': None,
+        'seconds': 0.0, 'steps': {'open_home': {'status': 'done', 'attempts': 1, 'seconds': 0.0, 'error': None}},
+    }
+
+
+def fake_init_worker(browser):
+    pass
+
+
+def read_sink(path):
+    """
+    Returns (scenario rows, step rows) written to a sink file.
+    """
+    if path.endswith('.db'):
+        connection = sqlite3.connect(path)
+        try:
+            return (connection.execute('SELECT COUNT(*) FROM scenarios').fetchone()[0],
+                    connection.execute('SELECT COUNT(*) FROM steps').fetchone()[0])
+        finally:
+            connection.close()
+    with open(path) as source:
+        results = [json.loads(line) for line in source]
+    return len(results), sum(len(result['steps']) for result in results)
+
+
+@pytest.mark.parametrize('name', ['results.jsonl', 'results.db'])
+def test_sink_writes_every_batch(tmp_path, name):
+    path = str(tmp_path / name)
+    with open_sink(path, BATCH_SIZE) as sink:
+        for index in range(RESULT_COUNT):
+            sink.write(fake_result((index, {})))
+    assert read_sink(path) == (RESULT_COUNT, RESULT_COUNT)
+
+
+@pytest.mark.parametrize('name', ['results.jsonl', 'results.db'])
+def test_run_matrix_writes_results_on_the_calling_thread(tmp_path, monkeypatch, name):
+    pytest.importorskip('selenium')
+    from Runner import ScenarioMatrix
+
+    monkeypatch.setattr(ScenarioMatrix, '_init_worker', fake_init_worker)
+    monkeypatch.setattr(ScenarioMatrix, '_run_scenario_steps', fake_result)
+    path = str(tmp_path / name)
+    rows = ScenarioMatrix.shard(({'slider_value_to_move': value} for value in range(RESULT_COUNT)))
+    with open_sink(path, BATCH_SIZE) as sink:
+        counts = ScenarioMatrix.run_matrix(rows, sink, workers=2, in_flight=2)
+    assert counts == (RESULT_COUNT, RESULT_COUNT // 2)
+    assert read_sink(path) == (RESULT_COUNT, RESULT_COUNT)
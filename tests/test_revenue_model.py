@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from App.RevenueModel import RevenueModel, format_total  # noqa: E402
+
+RATES = {'99091': 48, '99453': 19, '99454': 64}
+
+
+def test_expected_totals_multiply_patients_by_the_summed_rates():
+    totals = RevenueModel(RATES).expected_totals([10, 200], [['99091'], ['99453', '99454']])
+    assert totals.tolist() == [[480.0, 830.0], [9600.0, 16600.0]]
+
+
+def test_expected_total_matches_the_calculator_text():
+    model = RevenueModel(RATES)
+    assert model.expected_total(900, ['99091', '99453']) == '$60300'
+    assert format_total(12.5) == '$12.50'
+
+
+def test_table_lookup():
+    model = RevenueModel(RATES)
+    table = model.table([300, 100, 200], [['99091'], ['99454', '99453']])
+    assert table.lookup(200, ['99453', '99454']) == 200 * (19 + 64)
+    assert table.lookup(100, ['99091']) == 4800
+    assert model.table([100, 200, 300], [['99091'], ['99453', '99454']]) is table
+    with pytest.raises(KeyError):
+        table.lookup(150, ['99091'])
+    with pytest.raises(KeyError):
+        table.lookup(100, ['99453'])
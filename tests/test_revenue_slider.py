@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip('selenium')
+
+from selenium.webdriver import Keys  # noqa: E402
+from selenium.webdriver.remote.command import Command  # noqa: E402
+from App.RevenuePageFunctions import RevenuePageFunction  # noqa: E402
+
+
+class FakeSliderDriver:
+    """
+    Models the fixture slider: 0-2000 in steps of 1 on an 800 px track, so a pixel spans 2.5 values.
+    Commands are counted on execute, like on a real WebDriver.
+    """
+    track_left, track_width, maximum = 100, 800, 2000
+
+    def __init__(self, value):
+        self.value = value
+        self.commands = []
+
+    def thumb_x(self):
+        return self.track_left + self.value / self.maximum * self.track_width
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        if driver_command == Command.W3C_ACTIONS:
+            for source in params['actions']:
+                for action in source['actions']:
+                    if action['type'] == 'keyDown':
+                        step = {Keys.ARROW_RIGHT: 1, Keys.ARROW_LEFT: -1}[action['value']]
+                        self.value = min(max(self.value + step, 0), self.maximum)
+        return {'value': None}
+
+    def execute_script(self, script, *args):
+        self.execute(Command.W3C_EXECUTE_SCRIPT, {'script': script, 'args': list(args)})
+        return {'min': 0, 'max': self.maximum, 'step': 1, 'value': self.value, 'track_left': self.track_left,
+                'track_width': self.track_width, 'thumb_x': self.thumb_x(), 'thumb': None, 'input': None}
+
+    def drag(self, x_offset):
+        self.execute(Command.W3C_ACTIONS, {'actions': []})
+        landing = self.thumb_x() + x_offset
+        self.value = round((landing - self.track_left) / self.track_width * self.maximum)
+
+
+@pytest.mark.parametrize('target', [820, 821, 823, 561, 1337])
+def test_slider_reaches_off_pixel_targets_without_extra_drags(target):
+    driver = FakeSliderDriver(value=200)
+    page = RevenuePageFunction(driver=driver, explicit_timeout=1)
+    page.move_slider = lambda element_locator, x_value, y_value: driver.drag(x_value)
+
+    value, commands = page.move_slider_to_value(target)
+
+    assert value == target
+    assert commands == len(driver.commands)
+    assert driver.commands.count(Command.W3C_ACTIONS) <= 2
+    assert 'execute' not in vars(driver)
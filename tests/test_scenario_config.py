@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip('selenium')
+
+from Runner.ScenarioRunner import scenario_config  # noqa: E402
+
+
+def test_values_take_the_types_of_the_defaults():
+    cd = scenario_config({'slider_value_to_fill': 560, 'slider_value_to_move': '820', 'explicit_timeout': 5.0,
+                          'cpt_list_to_select': '99091, 99453'})
+    assert cd.slider_value_to_fill == '560'
+    assert cd.slider_value_to_move == 820
+    assert cd.explicit_timeout == 5
+    assert cd.cpt_list_to_select == ['99091', '99453']
+
+
+def test_none_and_untyped_fields_pass_through():
+    rates = {'99091': 48}
+    cd = scenario_config({'expected_total': None, 'cpt_reimbursement_rates': rates,
+                          'cpt_list_to_select': [99091, 99453]})
+    assert cd.expected_total is None
+    assert cd.cpt_reimbursement_rates is rates
+    assert cd.cpt_list_to_select == ['99091', '99453']
+
+
+def test_invalid_values_name_the_field():
+    with pytest.raises(ValueError, match='slider_value_to_move'):
+        scenario_config({'slider_value_to_move': 'many'})
+    with pytest.raises(ValueError, match='Unknown scenario field'):
+        scenario_config({'slider': 1})
@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip('selenium')
+
+from Runner.ScenarioMatrix import read_csv_scenarios, with_rates  # noqa: E402
+from Runner.ScenarioRunner import scenario_config  # noqa: E402
+
+
+def test_empty_expected_total_is_computed(tmp_path):
+    path = tmp_path / 'scenarios.csv'
+    path.write_text('slider_value_to_move,slider_value_to_fill,cpt_list_to_select,expected_total,cpt_reimbursement_rates\n'
+                    '900,900,99091;99453,,"{""99091"": 48, ""99453"": 19}"\n'
+                    '900,900,99091,$43200,\n')
+    computed, fixed = read_csv_scenarios(str(path))
+    assert computed['expected_total'] is None
+    assert computed['cpt_reimbursement_rates'] == {'99091': 48, '99453': 19}
+    assert computed['cpt_list_to_select'] == ['99091', '99453']
+    assert fixed['expected_total'] == '$43200'
+    assert 'cpt_reimbursement_rates' not in fixed
+    assert scenario_config(computed).expected_total is None
+
+
+def test_rates_fill_only_rows_without_rates():
+    rates, own = {'99091': 48}, {'99091': 50}
+    scenarios = [{'expected_total': None}, {'expected_total': None, 'cpt_reimbursement_rates': own}]
+    filled = list(with_rates(scenarios, rates))
+    assert filled[0]['cpt_reimbursement_rates'] is rates
+    assert filled[1]['cpt_reimbursement_rates'] is own
+    assert 'cpt_reimbursement_rates' not in scenarios[0]
+
+
+def test_product_rows_carry_looked_up_totals():
+    pytest.importorskip('numpy')
+    from App.RevenueModel import RevenueModel
+    from Runner.ScenarioMatrix import product_scenarios
+    from Runner.ScenarioRunner import revenue_cross_check_scenarios
+
+    sliders, cpt_sets = [100, 900], [['99091'], ['99091', '99453']]
+    table = RevenueModel({'99091': 48, '99453': 19}).table(sliders, cpt_sets)
+    rows = list(product_scenarios(sliders, cpt_sets, table))
+    assert [row['expected_total'] for row in rows] == ['$4800', '$6700', '$43200', '$60300']
+    assert all('cpt_reimbursement_rates' not in row for row in rows)
+    sample = revenue_cross_check_scenarios(table, 2, seed=0)
+    assert sample == revenue_cross_check_scenarios(table, 2, seed=0)
+    assert all(row['expected_total'] in {'$4800', '$6700', '$43200', '$60300'} for row in sample)
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from Runner import WorkerDaemon as daemon_module  # noqa: E402
+from Runner.WorkerClient import send_job  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StubPool:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def close(self):
+        pass
+
+
+def failed_relaunch(session_pool, cd, on_step=None):
+    # DriverBase.initiate_driver exits like this when a replacement browser cannot be launched
+    sys.exit(1)
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(daemon_module, 'DriverSessionPool', StubPool)
+    monkeypatch.setattr(daemon_module.main, 'resumable_automation', failed_relaunch)
+    socket_path = str(tmp_path / 'worker.sock')
+    server = daemon_module.WorkerDaemon(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+
+
+def test_a_failed_launch_is_reported_and_the_daemon_keeps_serving(daemon):
+    events = list(send_job({'scenario': {}}, daemon))
+    assert [event['event'] for event in events] == ['error']
+    assert 'exit code 1' in events[0]['error']
+    assert [event['event'] for event in send_job({'command': 'ping'}, daemon)] == ['pong']
+
+
+def test_the_client_fails_without_a_result(daemon):
+    client = subprocess.run([sys.executable, os.path.join(ROOT, 'Runner', 'WorkerClient.py'), '--socket', daemon],
+                            capture_output=True, text=True)
+    assert client.returncode == 1
+    assert 'Error: Could not launch the browser' in client.stdout